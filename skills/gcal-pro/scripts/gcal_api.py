@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: API Request Executor
+Runs every Calendar API request through one place: client-side throttling
+to stay under the per-user quota, retries with exponential backoff and
+jitter for transient failures, a circuit breaker for sustained outages, and
+structured errors instead of bare exceptions.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
+
+import gcal_cache
+
+# Transient failures are retried this many times before giving up
+MAX_RETRIES = int(os.environ.get("GCAL_PRO_MAX_RETRIES", "5"))
+# Backoff before retry n is uniform in [0, min(BACKOFF_CAP, BACKOFF_BASE * 2**n)]
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 32.0
+
+# Calendar's default per-user quota is 600 requests/minute; stay just under it
+REQUESTS_PER_SECOND = float(os.environ.get("GCAL_PRO_RATE_LIMIT", "9"))
+BURST_REQUESTS = 20
+
+# Consecutive transient failures that open the circuit, and how long it stays open
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_SECONDS = 30.0
+
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+# 403s that mean "slow down" rather than "forbidden"
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+
+class CalendarAPIError(Exception):
+    """
+    A Calendar API request failed.
+    
+    Attributes:
+        status: HTTP status, or None for transport errors
+        reason: Google error reason (e.g. "notFound", "rateLimitExceeded")
+        retryable: Whether the failure was transient (retries were exhausted)
+    """
+    
+    def __init__(self, message: str, status: int = None, reason: str = None,
+                 retryable: bool = False):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.reason = reason
+        self.retryable = retryable
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured form for results and JSON output."""
+        return {"message": self.message, "status": self.status,
+                "reason": self.reason, "retryable": self.retryable}
+
+
+class CircuitOpenError(CalendarAPIError):
+    """Raised without calling the API while the circuit breaker is open."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity`."""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1, sleep: Callable[[float], None] = time.sleep) -> float:
+        """Take `tokens`, sleeping until they are available. Returns seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve now (the balance may go negative) so concurrent callers queue up
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """
+    Fails fast after repeated transient failures.
+    
+    Closed: requests flow. After `threshold` consecutive failures it opens
+    and rejects requests for `reset_seconds`; then one trial request is let
+    through (half-open) and its outcome closes or re-opens the circuit.
+    """
+    
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half-open."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+    
+    def allow(self) -> bool:
+        """Check whether a request may be sent now."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial:
+                self._trial = True
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        """Close the circuit (the API answered)."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+    
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+    
+    def retry_after(self) -> float:
+        """Seconds until the circuit half-opens (0 if not open)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at))
+
+
+# Shared by every request in the process (all threads, all calendars)
+_bucket = TokenBucket(REQUESTS_PER_SECOND, BURST_REQUESTS)
+_breaker = CircuitBreaker(BREAKER_THRESHOLD, BREAKER_RESET_SECONDS)
+_stats = {"requests": 0, "retries": 0, "throttled_seconds": 0.0, "failures": 0}
+
+
+def _error_details(error: Exception) -> Tuple[Optional[str], Optional[str]]:
+    """Extract Google's (reason, message) from an HttpError body."""
+    try:
+        body = json.loads(error.content.decode("utf-8")).get("error", {})
+        errors = body.get("errors") or [{}]
+        return errors[0].get("reason") or body.get("status"), body.get("message")
+    except (AttributeError, ValueError, TypeError):
+        return None, None
+
+
+def _is_transport_error(error: Exception) -> bool:
+    """Network-level failure (timeout, reset, TLS, DNS) rather than an API answer."""
+    if isinstance(error, (OSError, ConnectionError)):
+        return True
+    module = type(error).__module__ or ""
+    return module.startswith("httplib2") or type(error).__name__ == "TransportError"
+
+
+def classify(error: Exception) -> CalendarAPIError:
+    """Turn any exception raised by request.execute() into a CalendarAPIError."""
+    if isinstance(error, CalendarAPIError):
+        return error
+    resp = getattr(error, "resp", None)
+    status = getattr(resp, "status", None)
+    if status is not None:
+        status = int(status)
+        reason, message = _error_details(error)
+        retryable = status in RETRYABLE_STATUSES or \
+            (status == 403 and reason in RATE_LIMIT_REASONS)
+        return CalendarAPIError(f"HTTP {status}: {message or reason or error}", status=status,
+                                reason=reason, retryable=retryable)
+    if _is_transport_error(error):
+        return CalendarAPIError(f"Network error: {error}", reason="transport", retryable=True)
+    return CalendarAPIError(str(error))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds requested by a Retry-After header, if any."""
+    resp = getattr(error, "resp", None)
+    try:
+        return float(resp.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def execute(
+    request,
+    retries: int = MAX_RETRIES,
+    cost: int = 1,
+    sleep: Callable[[float], None] = time.sleep,
+    cache: bool = False
+) -> Any:
+    """
+    Execute an API request (anything with .execute()) with throttling and retries.
+    
+    Args:
+        request: googleapiclient HttpRequest or BatchHttpRequest
+        retries: Retries allowed for transient failures
+        cost: Quota units the request consumes (batch: number of calls)
+        sleep: Sleep function (injectable for tests and benchmarks)
+        cache: Revalidate a GET against gcal_cache with If-None-Match; on
+            304 Not Modified the cached response is returned
+            
+    Returns:
+        The request's response (shared with the cache when cache=True;
+        treat it as read-only)
+        
+    Raises:
+        CalendarAPIError: On a permanent failure, or once retries are exhausted
+        CircuitOpenError: If the circuit breaker is open
+    """
+    cache = cache and getattr(request, "method", None) == "GET"
+    etag = gcal_cache.lookup(request.uri) if cache else None
+    if etag:
+        request.headers["If-None-Match"] = etag
+    
+    attempt = 0
+    while True:
+        if not _breaker.allow():
+            raise CircuitOpenError(
+                f"Calendar API unavailable after repeated failures; retrying in "
+                f"{_breaker.retry_after():.0f}s", reason="circuitOpen", retryable=True)
+        
+        _stats["throttled_seconds"] += _bucket.acquire(cost, sleep=sleep)
+        _stats["requests"] += 1
+        try:
+            response = request.execute()
+        except Exception as e:
+            if etag and getattr(getattr(e, "resp", None), "status", None) == 304:
+                _breaker.record_success()
+                response = gcal_cache.revalidated(request.uri, etag)
+                if response is not None:
+                    return response
+                # Evicted meanwhile: ask again for the full response
+                del request.headers["If-None-Match"]
+                etag = None
+                continue
+            error = classify(e)
+            if not error.retryable:
+                # The API answered; only transient failures count against the circuit
+                _breaker.record_success()
+                _stats["failures"] += 1
+                raise error from e
+            _breaker.record_failure()
+            if attempt >= retries:
+                _stats["failures"] += 1
+                raise error from e
+            _stats["retries"] += 1
+            sleep(max(_retry_after(e) or 0.0, backoff_delay(attempt)))
+            attempt += 1
+            continue
+        _breaker.record_success()
+        if cache:
+            gcal_cache.store(request.uri, response)
+        return response
+
+
+def stats() -> Dict[str, Any]:
+    """Process-wide counters plus the circuit breaker state."""
+    return dict(_stats, circuit=_breaker.state)
@@ -7,19 +7,39 @@ Handles secure local token storage and credential management.
 import os
 import sys
 import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+try:
+    import fcntl
+except ImportError:  # Windows: refreshes are only serialized within a process
+    fcntl = None
+
+# The Google client libraries take most of the startup time, so they are
+# imported inside the functions that talk to Google; commands answered from
+# local state never load them.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 # Configuration
 CONFIG_DIR = Path.home() / ".config" / "gcal-pro"
 CLIENT_SECRET_FILE = CONFIG_DIR / "client_secret.json"
 TOKEN_FILE = CONFIG_DIR / "token.json"
+TOKEN_LOCK_FILE = CONFIG_DIR / "token.lock"
 LICENSE_FILE = CONFIG_DIR / "license.json"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+
+# Calendar API built by build_calendar_service()
+API_NAME = "calendar"
+API_VERSION = "v3"
+
+# Long-lived processes (see enable_refresh_ahead) refresh access tokens in the
+# background once they are this close to expiry, so requests never wait for
+# the token endpoint
+REFRESH_AHEAD_SECONDS = int(os.environ.get("GCAL_PRO_REFRESH_AHEAD", "600"))
 
 # Scopes - Minimal permissions per tier
 SCOPES_FREE = ["https://www.googleapis.com/auth/calendar.readonly"]
@@ -28,6 +48,18 @@ SCOPES_PRO = [
     "https://www.googleapis.com/auth/calendar.events"
 ]
 
+# Process-wide session state, reused by every call to get_calendar_service().
+# The credentials and the service (with its pooled, thread-safe transport)
+# are shared by all threads.
+_session_lock = threading.RLock()
+_session_creds: Optional["Credentials"] = None
+_session_service = None
+_token_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
+# Off in short CLI commands, which could exit in the middle of a background
+# refresh; they refresh inline once the token has expired
+_refresh_ahead_enabled = False
+
 
 def get_config_dir() -> Path:
     """Ensure config directory exists and return path."""
@@ -40,8 +72,21 @@ def check_client_secret() -> bool:
     return CLIENT_SECRET_FILE.exists()
 
 
+def load_config() -> dict:
+    """Load user settings from config.json (empty if missing or invalid)."""
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            config = json.load(f)
+        return config if isinstance(config, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not read {CONFIG_FILE}: {e}")
+        return {}
+
+
 def is_pro_user() -> bool:
-    """Check if user has Pro license."""
+    """Check if user has Pro license (cached by gcal_license until the file changes)."""
     try:
         from gcal_license import is_pro
         return is_pro()
@@ -62,7 +107,7 @@ def get_scopes() -> list:
     return SCOPES_PRO if is_pro_user() else SCOPES_FREE
 
 
-def get_credentials(force_refresh: bool = False) -> Optional[Credentials]:
+def get_credentials(force_refresh: bool = False) -> Optional["Credentials"]:
     """
     Get valid credentials, refreshing or re-authenticating as needed.
     
@@ -74,11 +119,18 @@ def get_credentials(force_refresh: bool = False) -> Optional[Credentials]:
     """
     get_config_dir()
     
+    if force_refresh:
+        reset_session()
+    
     if not check_client_secret():
         print(f"ERROR: client_secret.json not found at {CLIENT_SECRET_FILE}")
         print("Please complete Google Cloud setup first.")
         return None
     
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    
     creds = None
     scopes = get_scopes()
     
@@ -93,11 +145,12 @@ def get_credentials(force_refresh: bool = False) -> Optional[Credentials]:
     # Check if credentials need refresh or re-auth
     if creds and creds.expired and creds.refresh_token:
         try:
-            creds.refresh(Request())
-            _save_token(creds)
+            _refresh_token(creds)
         except Exception as e:
             print(f"Token refresh failed: {e}")
             creds = None
+    elif creds and creds.valid:
+        _refresh_ahead(creds)
     
     # Need new authentication
     if not creds or not creds.valid:
@@ -119,40 +172,221 @@ def get_credentials(force_refresh: bool = False) -> Optional[Credentials]:
     return creds
 
 
-def _save_token(creds: Credentials) -> None:
-    """Save credentials to token file."""
-    with open(TOKEN_FILE, "w") as token_file:
-        token_file.write(creds.to_json())
-    # Secure the token file (readable only by owner on Unix)
+def _save_token(creds: "Credentials") -> None:
+    """
+    Save credentials to token file.
+    
+    The token is written to a temporary file and renamed over token.json,
+    so concurrent readers see either the old or the new token, never a
+    partial file.
+    """
+    tmp_path = TOKEN_FILE.with_name(f"{TOKEN_FILE.name}.{os.getpid()}.tmp")
+    # Created readable only by owner on Unix (Windows ignores the mode)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
     try:
-        os.chmod(TOKEN_FILE, 0o600)
-    except (OSError, AttributeError):
-        pass  # Windows doesn't support chmod the same way
+        with os.fdopen(fd, "w") as token_file:
+            token_file.write(creds.to_json())
+            token_file.flush()
+            os.fsync(token_file.fileno())
+        os.replace(tmp_path, TOKEN_FILE)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _token_file_lock():
+    """
+    Hold the token refresh lock.
+    
+    Threads of this process are serialized by a mutex and processes by an
+    flock on token.lock (where fcntl exists), so one refresh runs at a time
+    and the waiters reuse its result.
+    """
+    with _token_lock:
+        if fcntl is None:
+            yield
+            return
+        get_config_dir()
+        with open(TOKEN_LOCK_FILE, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _seconds_left(creds: "Credentials") -> float:
+    """Seconds until the access token expires (inf if it has no expiry)."""
+    if creds.expiry is None:
+        return float("inf")
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (creds.expiry - now).total_seconds()
+
+
+def _refresh_token(creds: "Credentials", ahead: float = 0) -> None:
+    """
+    Refresh `creds` in place under the token lock and save the result.
+    
+    If another process or thread stored a token valid for more than
+    `ahead` seconds while we waited for the lock, that token is adopted
+    instead of calling the token endpoint again.
+    
+    Raises:
+        google.auth.exceptions.RefreshError: If the refresh fails
+    """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    
+    with _token_file_lock():
+        try:
+            stored = Credentials.from_authorized_user_file(str(TOKEN_FILE))
+        except (OSError, ValueError):
+            stored = None
+        if stored is not None and stored.token != creds.token and \
+                stored.refresh_token == creds.refresh_token and _seconds_left(stored) > ahead:
+            creds.token = stored.token
+            creds.expiry = stored.expiry
+            return
+        type(creds).refresh(creds, Request())  # Not creds.refresh: see _route_refresh
+        _save_token(creds)
+
+
+def _route_refresh(creds: "Credentials") -> None:
+    """
+    Send every refresh of `creds` through _refresh_token.
+    
+    The AuthorizedSession under PooledHttp (on an expired token or a 401)
+    and googleapiclient's batch requests call creds.refresh() themselves;
+    routed here, those refreshes take the token lock and save token.json.
+    """
+    creds.refresh = lambda request: _refresh_token(creds)
+
+
+def enable_refresh_ahead() -> None:
+    """Refresh tokens in the background before they expire (daemon, receiver)."""
+    global _refresh_ahead_enabled
+    _refresh_ahead_enabled = True
+
+
+def _refresh_ahead(creds: "Credentials") -> None:
+    """Refresh a still-valid token in the background if it expires soon."""
+    global _refresh_thread
+    
+    if not _refresh_ahead_enabled or not creds.refresh_token or \
+            _seconds_left(creds) > REFRESH_AHEAD_SECONDS:
+        return
+    with _session_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        
+        def run():
+            try:
+                _refresh_token(creds, ahead=REFRESH_AHEAD_SECONDS)
+            except Exception:
+                pass  # The token is still valid; a later request refreshes inline
+        
+        _refresh_thread = threading.Thread(target=run, name="gcal-token-refresh", daemon=True)
+        _refresh_thread.start()
+
+
+def _get_session_credentials() -> Optional["Credentials"]:
+    """
+    Return the process-wide credentials, loading them from disk only once.
+    
+    Cached credentials are refreshed in place when they expire (or, in a
+    long-lived process, in the background shortly before), so the service
+    built on top of them keeps working without a rebuild.
+    """
+    global _session_creds
+    
+    with _session_lock:
+        creds = _session_creds
+        if creds is not None:
+            if creds.valid:
+                _refresh_ahead(creds)
+                return creds
+            if creds.expired and creds.refresh_token:
+                try:
+                    _refresh_token(creds)
+                    return creds
+                except Exception as e:
+                    print(f"Token refresh failed: {e}")
+            reset_session()
+        
+        _session_creds = get_credentials()
+        return _session_creds
+
+
+def build_calendar_service(creds: "Credentials"):
+    """
+    Build a Calendar API resource without fetching discovery over the network.
+    
+    Requests use a PooledHttp transport (keep-alive connection pool) rather
+    than a per-service httplib2.Http.
+    
+    Args:
+        creds: Authorized credentials (their refreshes are routed through
+            _refresh_token)
+            
+    Returns:
+        Google Calendar API service object
+    """
+    from googleapiclient.discovery import build
+    from gcal_http import PooledHttp
+    
+    _route_refresh(creds)
+    return build(API_NAME, API_VERSION, http=PooledHttp(creds),
+                 static_discovery=True, cache_discovery=False)
 
 
 def get_calendar_service():
     """
     Get authenticated Google Calendar API service.
     
+    The service is built once per process and shared by all callers and
+    threads, so they share one pool of keep-alive connections; credentials
+    are only re-read or refreshed when they expire.
+    
     Returns:
         Google Calendar API service object or None
     """
-    creds = get_credentials()
+    global _session_service
+    
+    creds = _get_session_credentials()
     if not creds:
         return None
     
-    try:
-        service = build("calendar", "v3", credentials=creds)
-        return service
-    except Exception as e:
-        print(f"Failed to build Calendar service: {e}")
-        return None
+    with _session_lock:
+        if _session_service is not None:
+            return _session_service
+        try:
+            _session_service = build_calendar_service(creds)
+            return _session_service
+        except Exception as e:
+            print(f"Failed to build Calendar service: {e}")
+            return None
+
+
+def reset_session() -> None:
+    """Drop the cached credentials and services (e.g. after re-auth or revoke)."""
+    global _session_creds, _session_service
+    with _session_lock:
+        _session_creds = None
+        # Threads still holding the old service finish with the old credentials
+        _session_service = None
 
 
 def revoke_credentials() -> bool:
     """Revoke current credentials and delete local tokens."""
+    reset_session()
     if TOKEN_FILE.exists():
         try:
+            from google.oauth2.credentials import Credentials
             creds = Credentials.from_authorized_user_file(str(TOKEN_FILE))
             # Attempt to revoke via Google
             import requests
@@ -186,6 +420,7 @@ def get_auth_status() -> dict:
     
     if TOKEN_FILE.exists():
         try:
+            from google.oauth2.credentials import Credentials
             creds = Credentials.from_authorized_user_file(str(TOKEN_FILE))
             status["authenticated"] = creds.valid or (creds.expired and creds.refresh_token)
             status["scopes"] = list(creds.scopes) if creds.scopes else []
@@ -0,0 +1,1102 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: Benchmarks
+Measures startup and hot-path costs of the gcal-pro scripts.
+"""
+
+import json
+import os
+import sys
+import subprocess
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Optional, Callable
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def _time_subprocess(args: List[str], env: Dict[str, str] = None, runs: int = 5) -> List[float]:
+    """Run a command `runs` times in fresh interpreters and return wall times."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=SCRIPTS_DIR, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    """Print median/min for a set of timings in milliseconds."""
+    print(f"  {label:<28} median {statistics.median(timings) * 1000:8.1f} ms"
+          f"   min {min(timings) * 1000:8.1f} ms")
+
+
+# Service construction in a fresh interpreter
+_BUILD_SNIPPET = """
+import time
+from google.auth.credentials import AnonymousCredentials
+from gcal_auth import build_calendar_service
+start = time.perf_counter()
+build_calendar_service(AnonymousCredentials())
+print(time.perf_counter() - start)
+"""
+
+
+def bench_startup(runs: int = 5) -> None:
+    """Time service construction and the view commands from cold starts."""
+    print("Service build (fresh interpreter each run):")
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _BUILD_SNIPPET], cwd=SCRIPTS_DIR,
+                             capture_output=True, text=True, check=False)
+        try:
+            timings.append(float(out.stdout.strip().splitlines()[-1]))
+        except (ValueError, IndexError):
+            print(f"  build_calendar_service(): failed ({out.stderr.strip().splitlines()[-1:]})")
+            break
+    else:
+        _report("build_calendar_service()", timings)
+    
+    from gcal_auth import TOKEN_FILE
+    if not TOKEN_FILE.exists():
+        print("\nCLI commands skipped: not authenticated (run gcal_auth.py auth).")
+        return
+    
+    print("\nCLI commands (wall time, fresh interpreter each run):")
+    for command in ("today", "week", "brief"):
+        args = [sys.executable, "gcal_core.py", command]
+        _report(command, _time_subprocess(args, runs=runs))
+
+
+# CLI invocations profiled by bench_importtime(); all are answered from
+# local state in the sandbox, so they show what a cold start really loads
+IMPORT_COMMANDS = [
+    ["gcal_license.py", "status"],
+    ["gcal_auth.py", "status"],
+    ["gcal_sync.py", "status"],
+    ["gcal_core.py", "today"],
+    ["gcal_core.py", "brief"],
+    ["gcal_core.py", "free"],
+]
+
+# Packages whose import cost the lazy imports are meant to avoid
+HEAVY_MODULES = ("googleapiclient", "google_auth_oauthlib", "google.auth",
+                 "google.oauth2", "httplib2", "requests", "dateutil")
+
+# Fill a sandbox config dir with a fresh (empty) event store and a
+# precomputed brief, so the profiled commands never need the network
+_SANDBOX_SNIPPET = """
+import gcal_sync
+from gcal_core import precompute_morning_brief
+
+class _Page:
+    def execute(self):
+        return {"items": [], "nextSyncToken": "bench"}
+        
+class _Events:
+    def list(self, **params):
+        return _Page()
+        
+class _Service:
+    def events(self):
+        return _Events()
+        
+gcal_sync.full_sync(_Service(), "primary")
+precompute_morning_brief()
+"""
+
+
+def _import_profile(args: List[str], env: Dict[str, str]) -> Tuple[float, float, List[str]]:
+    """Run a command under -X importtime: (wall s, total import s, heavy packages loaded)."""
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-X", "importtime"] + args, cwd=SCRIPTS_DIR,
+                         env=env, capture_output=True, text=True, check=False)
+    wall = time.perf_counter() - start
+    
+    total_us = 0
+    heavy = set()
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        try:
+            total_us += int(self_us)
+        except ValueError:
+            continue  # Header line
+        name = name.strip()
+        heavy.update(h for h in HEAVY_MODULES if name == h or name.startswith(h + "."))
+    return wall, total_us / 1e6, sorted(heavy)
+
+
+def bench_importtime(runs: int = 5) -> None:
+    """Profile cold start (-X importtime) of each CLI subcommand in a sandbox HOME."""
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+        env.setdefault("GCAL_PRO_TIMEZONE", "America/New_York")
+        setup = subprocess.run([sys.executable, "-c", _SANDBOX_SNIPPET], cwd=SCRIPTS_DIR,
+                               env=env, capture_output=True, text=True, check=False)
+        if setup.returncode:
+            print(f"Sandbox setup failed: {setup.stderr.strip().splitlines()[-1:]}")
+            return
+        
+        print("CLI cold start (fresh interpreter each run, -X importtime):")
+        for args in IMPORT_COMMANDS:
+            walls, imports = [], []
+            for _ in range(runs):
+                wall, import_s, heavy = _import_profile(args, env)
+                walls.append(wall)
+                imports.append(import_s)
+            label = " ".join(args)
+            print(f"  {label:<28} wall {statistics.median(walls) * 1000:7.1f} ms"
+                  f"   imports {statistics.median(imports) * 1000:7.1f} ms"
+                  f"   heavy: {', '.join(heavy) or '-'}")
+
+
+def synthetic_events(count: int = 10000) -> List[Dict[str, Any]]:
+    """Build raw API-shaped event payloads (mix of timed, UTC and all-day)."""
+    base = datetime(2026, 1, 5, 8, 0, tzinfo=timezone(timedelta(hours=-5)))
+    events = []
+    for i in range(count):
+        start = base + timedelta(minutes=37 * i)
+        end = start + timedelta(minutes=30 + 15 * (i % 4))
+        if i % 10 == 0:
+            times = ({"date": start.date().isoformat()},
+                     {"date": (start.date() + timedelta(days=1)).isoformat()})
+        elif i % 3 == 0:
+            utc = timezone.utc
+            times = ({"dateTime": start.astimezone(utc).strftime("%Y-%m-%dT%H:%M:%SZ")},
+                     {"dateTime": end.astimezone(utc).strftime("%Y-%m-%dT%H:%M:%SZ")})
+        else:
+            times = ({"dateTime": start.isoformat(), "timeZone": "America/New_York"},
+                     {"dateTime": end.isoformat(), "timeZone": "America/New_York"})
+        events.append({
+            "id": f"evt{i:05d}",
+            "etag": f'"{i}"',
+            "status": "confirmed",
+            "summary": f"Meeting {i}",
+            "description": "Weekly sync" if i % 2 else None,
+            "location": "Room 4" if i % 5 == 0 else None,
+            "start": times[0],
+            "end": times[1],
+            "attendees": [{"email": f"person{j}@example.com"} for j in range(i % 6)],
+            "htmlLink": f"https://www.google.com/calendar/event?eid={i}",
+            "organizer": {"email": "owner@example.com"}
+        })
+    return events
+
+
+def _legacy_parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """_parse_event as it was before the fast path: dateutil + new ZoneInfo per event."""
+    from zoneinfo import ZoneInfo
+    from dateutil import parser as date_parser
+    
+    def parse(value):
+        tz = ZoneInfo("America/New_York")
+        if "dateTime" in value:
+            dt = date_parser.parse(value["dateTime"])
+            return dt if dt.tzinfo else dt.replace(tzinfo=tz)
+        elif "date" in value:
+            return date_parser.parse(value["date"]).replace(tzinfo=tz)
+        return None
+    
+    start = event.get("start", {})
+    end = event.get("end", {})
+    return {
+        "id": event.get("id"),
+        "summary": event.get("summary", "(No title)"),
+        "description": event.get("description"),
+        "location": event.get("location"),
+        "start": start.get("dateTime") or start.get("date"),
+        "end": end.get("dateTime") or end.get("date"),
+        "start_dt": parse(start),
+        "end_dt": parse(end),
+        "all_day": "date" in start,
+        "attendees": [a.get("email") for a in event.get("attendees", [])],
+        "html_link": event.get("htmlLink"),
+        "status": event.get("status"),
+        "organizer": event.get("organizer", {}).get("email")
+    }
+
+
+def bench_parse(count: int = 10000, runs: int = 5) -> None:
+    """Time _parse_event over synthetic payloads against the dateutil version."""
+    from gcal_core import _parse_event
+    
+    events = synthetic_events(count)
+    
+    # Both parsers must agree before their speed means anything
+    for event in events[:500]:
+        old, new = _legacy_parse_event(event), _parse_event(event)
+        assert old["start_dt"] == new["start_dt"] and old["end_dt"] == new["end_dt"], event
+    
+    print(f"_parse_event over {count} synthetic events:")
+    results = {}
+    for label, parse in (("dateutil [before]", _legacy_parse_event),
+                         ("fromisoformat [after]", _parse_event)):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            for event in events:
+                # Touch the datetimes: Event parses them lazily
+                parsed = parse(event)
+                parsed["start_dt"], parsed["end_dt"]
+            timings.append(time.perf_counter() - start)
+        results[label] = statistics.median(timings)
+        _report(label, timings)
+    before, after = results.values()
+    print(f"  speedup: {before / after:.1f}x ({after / count * 1e6:.2f} µs/event)")
+
+
+def full_resource(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Dress a synthetic event with the fields a real events().list item carries."""
+    i = int(event["id"][3:])
+    full = dict(event)
+    full.update({
+        "kind": "calendar#event",
+        "created": "2025-11-02T14:03:11.000Z",
+        "updated": "2026-01-04T09:12:45.123Z",
+        "creator": {"email": "owner@example.com", "self": True},
+        "organizer": {"email": "owner@example.com", "displayName": "Owner", "self": True},
+        "iCalUID": f"{event['id']}@google.com",
+        "sequence": i % 3,
+        "eventType": "default",
+        "reminders": {"useDefault": False,
+                      "overrides": [{"method": "popup", "minutes": 10},
+                                    {"method": "email", "minutes": 60}]},
+        "attendees": [{"email": a["email"], "displayName": f"Person {j}",
+                       "responseStatus": ("accepted", "needsAction", "tentative")[j % 3],
+                       "optional": j % 4 == 3}
+                      for j, a in enumerate(event.get("attendees") or [])]
+    })
+    if i % 2:
+        full["hangoutLink"] = f"https://meet.google.com/abc-defg-{i:03d}"
+        full["conferenceData"] = {
+            "entryPoints": [
+                {"entryPointType": "video", "uri": full["hangoutLink"],
+                 "label": f"meet.google.com/abc-defg-{i:03d}"},
+                {"entryPointType": "phone", "uri": "tel:+1-555-0100", "label": "+1 555-0100",
+                 "pin": "123456789"}
+            ],
+            "conferenceSolution": {"key": {"type": "hangoutsMeet"}, "name": "Google Meet",
+                                   "iconUri": "https://fonts.gstatic.com/s/i/productlogos/meet.png"},
+            "conferenceId": f"abc-defg-{i:03d}"
+        }
+    return full
+
+
+def _split_fields(mask: str) -> List[str]:
+    """Split a fields= mask on its top-level commas."""
+    parts, depth, start = [], 0, 0
+    for pos, char in enumerate(mask):
+        depth += (char == "(") - (char == ")")
+        if char == "," and depth == 0:
+            parts.append(mask[start:pos])
+            start = pos + 1
+    parts.append(mask[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def apply_fields_mask(value: Any, mask: str) -> Any:
+    """Project a resource the way the API answers a fields= partial-response request."""
+    if isinstance(value, list):
+        return [apply_fields_mask(item, mask) for item in value]
+    projected = {}
+    for part in _split_fields(mask):
+        name, _, sub = part.partition("(")
+        if name in value:
+            projected[name] = apply_fields_mask(value[name], sub[:-1]) if sub else value[name]
+    return projected
+
+
+def bench_fields(count: int = 10000, runs: int = 5) -> None:
+    """Payload bytes and parse time of an events page: full resources vs the EVENT_FIELDS mask."""
+    from google.auth.credentials import AnonymousCredentials
+    import gcal_api
+    import gcal_core
+    from gcal_http import PooledHttp
+    
+    page = {"kind": "calendar#events", "etag": '"bench"', "summary": "owner@example.com",
+            "timeZone": "America/New_York", "accessRole": "owner",
+            "defaultReminders": [{"method": "popup", "minutes": 10}],
+            "items": [full_resource(e) for e in synthetic_events(count)]}
+    masked = apply_fields_mask(page, f"etag,nextPageToken,items({gcal_core.EVENT_FIELDS})")
+    
+    def parse(payload: bytes) -> List[Any]:
+        events = [gcal_core._parse_event(e) for e in json.loads(payload)["items"]]
+        for event in events:
+            event.start_dt, event.end_dt, event.attendees  # Parsed lazily
+        return events
+    
+    print(f"events().list page of {count} events:")
+    results = {}
+    for label, body in (("full resources [before]", page), ("fields= mask [after]", masked)):
+        payload = json.dumps(body).encode("utf-8")
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            parse(payload)
+            timings.append(time.perf_counter() - start)
+        results[label] = (len(payload), statistics.median(timings))
+        print(f"  {label:<24} {len(payload) / 1024:9.1f} KiB   parse median "
+              f"{statistics.median(timings) * 1000:7.1f} ms   min {min(timings) * 1000:7.1f} ms")
+    (full_bytes, full_time), (masked_bytes, masked_time) = results.values()
+    print(f"  payload -{1 - masked_bytes / full_bytes:.0%}, parse {full_time / masked_time:.1f}x faster")
+    
+    # The mask must cover everything the parser reads, and be what is sent
+    requested = []
+    
+    def route(path: str, headers) -> Tuple[int, Dict[str, Any]]:
+        requested.append(path)
+        return 200, masked if "fields=" in path else page
+    
+    server = _stand_in_server(route)
+    service = _stand_in_service(server, PooledHttp(AnonymousCredentials()))
+    gcal_core.get_calendar_service = lambda: service
+    gcal_api._bucket = gcal_api.TokenBucket(0, 0)
+    now = gcal_core.now_local()
+    fetched = [e.to_dict(datetimes=False) for e in
+               gcal_core.iter_events(now, now, page_size=count)]
+    full = [gcal_core._parse_event(e, "primary").to_dict(datetimes=False) for e in page["items"]]
+    ok = fetched == full and "fields=" in requested[-1]
+    print(f"  {'PASS' if ok else 'FAIL'}  iter_events sends the mask and parses the same events")
+    unmasked = next(gcal_core.iter_events(now, now, page_size=1, fields=None))
+    server.shutdown()
+    ok_full = "fields=" not in requested[-1] and unmasked.to_dict(datetimes=False) == full[0]
+    print(f"  {'PASS' if ok_full else 'FAIL'}  fields=None requests full resources")
+    if not (ok and ok_full):
+        sys.exit(1)
+
+
+def bench_memory(count: int = 10000) -> None:
+    """Compare memory held by parsed events: old dicts vs Event objects."""
+    import tracemalloc
+    from gcal_core import _parse_event
+    
+    events = synthetic_events(count)
+    print(f"Memory for {count} parsed events (raw payloads excluded):")
+    results = {}
+    for label, parse in (("dict [before]", _legacy_parse_event),
+                         ("Event [after]", _parse_event)):
+        tracemalloc.start()
+        parsed = [parse(event) for event in events]
+        # Typical consumers (display, free/busy) read the times, not attendees
+        for event in parsed:
+            event["start_dt"], event["end_dt"]
+        results[label] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del parsed
+        print(f"  {label:<28} {results[label] / 1024:10.0f} KiB"
+              f"   ({results[label] / count:.0f} B/event)")
+    before, after = results.values()
+    print(f"  reduction: {100 * (1 - after / before):.0f}%")
+
+
+# Natural-language phrases and what they mean relative to NL_REFERENCE
+# (Wednesday 2026-01-14 10:30 local); checked before timing
+NL_REFERENCE = (2026, 1, 14, 10, 30)
+NL_CORPUS = [
+    ("today", "2026-01-14 09:00"),
+    ("tomorrow", "2026-01-15 09:00"),
+    ("tomorrow 2pm", "2026-01-15 14:00"),
+    ("tomorrow at 9:30am", "2026-01-15 09:30"),
+    ("next week", "2026-01-21 09:00"),
+    ("next Friday 3pm", "2026-01-16 15:00"),
+    ("Friday", "2026-01-16 09:00"),
+    ("friday at noon", "2026-01-16 12:00"),
+    ("this thursday 4:15 pm", "2026-01-15 16:15"),
+    ("next wednesday", "2026-01-21 09:00"),
+    ("wednesday", "2026-01-14 09:00"),
+    ("mon 10am", "2026-01-19 10:00"),
+    ("3pm", "2026-01-14 15:00"),
+    ("at 15:30", "2026-01-14 15:30"),
+    ("5pm tomorrow", "2026-01-15 17:00"),
+    ("tonight", "2026-01-14 20:00"),
+    ("eod", "2026-01-14 17:00"),
+    ("end of week", "2026-01-16 17:00"),
+    ("in 2 hours", "2026-01-14 12:30"),
+    ("in 45 minutes", "2026-01-14 11:15"),
+    ("in 3 days", "2026-01-17 10:30"),
+    ("now", "2026-01-14 10:30"),
+    ("January 20 2pm", "2026-01-20 14:00"),
+    ("2026-02-03 08:00", "2026-02-03 08:00"),
+]
+
+
+def _legacy_parse_datetime(text: str, reference: datetime) -> datetime:
+    """parse_datetime before the rule table: three phrases, then fuzzy dateutil."""
+    from dateutil import parser as date_parser
+    
+    text_lower = text.lower().strip()
+    if text_lower == "today":
+        return reference.replace(hour=9, minute=0, second=0, microsecond=0)
+    elif text_lower == "tomorrow":
+        return (reference + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+    elif text_lower == "next week":
+        return (reference + timedelta(weeks=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+    parsed = date_parser.parse(text, fuzzy=True, default=reference)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=reference.tzinfo)
+    return parsed
+
+
+def bench_nlparse(runs: int = 5, repeat: int = 200) -> None:
+    """Check the NL date corpus, then time it against the dateutil-only parser."""
+    from gcal_core import get_timezone
+    import gcal_dates
+    
+    reference = datetime(*NL_REFERENCE, tzinfo=get_timezone())
+    failures = 0
+    for phrase, expected in NL_CORPUS:
+        got = gcal_dates.parse_datetime(phrase, reference).strftime("%Y-%m-%d %H:%M")
+        if got != expected:
+            failures += 1
+            print(f"  MISMATCH {phrase!r}: got {got}, expected {expected}")
+    print(f"Corpus: {len(NL_CORPUS) - failures}/{len(NL_CORPUS)} phrases correct")
+    
+    def uncached(phrase, ref):
+        gcal_dates._resolve.cache_clear()
+        return gcal_dates.parse_datetime(phrase, ref)
+    
+    calls = len(NL_CORPUS) * repeat
+    print(f"Parsing the corpus {repeat}x ({calls} calls):")
+    results = {}
+    for label, parse in (("dateutil fuzzy [before]", _legacy_parse_datetime),
+                         ("rule table, no cache", uncached),
+                         ("rule table + LRU [after]", gcal_dates.parse_datetime)):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for phrase, _expected in NL_CORPUS:
+                    try:
+                        parse(phrase, reference)
+                    except ValueError:
+                        pass  # the legacy parser rejects some phrases
+            timings.append(time.perf_counter() - start)
+        results[label] = statistics.median(timings)
+        _report(label, timings)
+    before, after = results["dateutil fuzzy [before]"], results["rule table + LRU [after]"]
+    print(f"  speedup: {before / after:.1f}x ({after / calls * 1e6:.2f} µs/call)")
+    print(f"  {gcal_dates.cache_info()}")
+    if failures:
+        sys.exit(1)
+
+
+def bench_watch(burst: int = 50) -> None:
+    """Replay push-notification headers against a local receiver and check its responses."""
+    import http.client
+    import tempfile
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    import gcal_sync
+    import gcal_watch
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        gcal_sync.STORE_FILE = Path(tmp) / "events.db"
+        channel = {"channel_id": "bench-channel", "calendar_id": "primary",
+                   "resource_id": "bench-resource", "token": "bench-token",
+                   "address": "https://example.invalid/notify",
+                   "expiration": time.time() + 3600}
+        gcal_sync.save_channel(channel)
+        
+        synced: List[str] = []
+        
+        def fake_sync(calendar_id: str) -> None:
+            time.sleep(0.02)  # Roughly an incremental sync round-trip
+            synced.append(calendar_id)
+        
+        receiver = gcal_watch.NotificationReceiver("127.0.0.1", 0, on_change=fake_sync)
+        threading.Thread(target=receiver.serve_forever, daemon=True).start()
+        
+        def post(state: str = "exists", **overrides: str) -> int:
+            headers = {"X-Goog-Channel-ID": channel["channel_id"],
+                       "X-Goog-Channel-Token": channel["token"],
+                       "X-Goog-Resource-ID": channel["resource_id"],
+                       "X-Goog-Resource-State": state,
+                       "X-Goog-Message-Number": "1"}
+            headers.update(overrides)
+            conn = http.client.HTTPConnection("127.0.0.1", receiver.server_port)
+            try:
+                conn.request("POST", "/", headers=headers)
+                return conn.getresponse().status
+            finally:
+                conn.close()
+        
+        failures = 0
+        
+        def check(label: str, ok: bool) -> None:
+            nonlocal failures
+            failures += not ok
+            print(f"  {'PASS' if ok else 'FAIL'}  {label}")
+        
+        print("Notification replay against a local receiver:")
+        check("sync handshake acknowledged, no sync", post("sync") == 200 and not synced)
+        check("unknown channel rejected (404)",
+              post(**{"X-Goog-Channel-ID": "nope"}) == 404)
+        check("wrong token rejected (403)", post(**{"X-Goog-Channel-Token": "x"}) == 403)
+        check("wrong resource rejected (403)", post(**{"X-Goog-Resource-ID": "x"}) == 403)
+        
+        start = time.perf_counter()
+        status = post("exists")
+        receiver.wait_idle(timeout=5)
+        latency = time.perf_counter() - start
+        check(f"change triggers a sync ({latency * 1000:.1f} ms to sync)",
+              status == 200 and synced == ["primary"])
+        
+        synced.clear()
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            statuses = list(pool.map(lambda _: post("exists"), range(burst)))
+        receiver.wait_idle(timeout=5)
+        check(f"burst of {burst} notifications -> {len(synced)} sync(s)",
+              set(statuses) == {200} and 1 <= len(synced) < burst)
+        
+        gcal_sync.touch_channels()
+        check("calendar counts as watched while the receiver is alive",
+              gcal_sync.is_watched("primary"))
+        receiver.shutdown()
+    
+    if failures:
+        sys.exit(1)
+
+
+def bench_license(runs: int = 5, checks: int = 10000) -> None:
+    """Per-check cost of the license lookup: cached state vs reading license.json each time."""
+    import tempfile
+    import gcal_auth
+    import gcal_license
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        gcal_license.LICENSE_FILE = Path(tmp) / "license.json"
+        gcal_license.LICENSE_FILE.write_text(json.dumps(
+            {"key": "GCAL-BENCH-0000-0000", "tier": "pro", "valid": True}))
+        gcal_license.invalidate_cache()
+        
+        def per_check(fn) -> List[float]:
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                for _ in range(checks):
+                    fn()
+                timings.append((time.perf_counter() - start) / checks)
+            return timings
+        
+        legacy = per_check(gcal_license._read_license_file)
+        cached = per_check(gcal_auth.is_pro_user)
+        print(f"License check ({checks} checks x {runs} runs):")
+        for label, timings in (("read + parse every call", legacy),
+                               ("cached, stat() only", cached)):
+            print(f"  {label:<28} median {statistics.median(timings) * 1e6:8.1f} us/check")
+        print(f"  Speedup: {statistics.median(legacy) / statistics.median(cached):.1f}x")
+        
+        # A write operation checks the tier for its scopes and its Pro gate
+        gcal_license.LICENSE_FILE.write_text(json.dumps({"tier": "free"}))
+        changed = not gcal_auth.is_pro_user()
+        gcal_license.LICENSE_FILE.unlink()
+        removed = not gcal_auth.is_pro_user()
+        print(f"  Invalidated on rewrite/removal: {'yes' if changed and removed else 'NO'}")
+        if not (changed and removed):
+            sys.exit(1)
+
+
+def _stand_in_server(route: Callable[[str, Any], Tuple[int, Optional[Dict[str, Any]]]]):
+    """
+    Start a local keep-alive HTTP server standing in for the Calendar API.
+    
+    `route(path, headers)` returns (status, JSON body or None). The server's
+    `connections` set records client addresses and `body_bytes` counts
+    response body bytes sent.
+    """
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True  # Headers and body go out as separate writes
+        
+        def do_GET(self) -> None:
+            self.server.connections.add(self.client_address)
+            status, body = route(self.path, self.headers)
+            payload = json.dumps(body).encode("utf-8") if body is not None else b""
+            self.server.body_bytes += len(payload)
+            self.send_response(status)
+            if body is not None:
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                if isinstance(body, dict) and body.get("etag"):
+                    self.send_header("ETag", body["etag"])
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def log_message(self, format: str, *args) -> None:
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.connections = set()
+    server.body_bytes = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _stand_in_service(server, http):
+    """Calendar service built on `http` whose requests go to a _stand_in_server."""
+    from googleapiclient.discovery import build
+    from gcal_auth import API_NAME, API_VERSION
+    
+    return build(API_NAME, API_VERSION, http=http, static_discovery=True, client_options={
+        "api_endpoint": f"http://127.0.0.1:{server.server_port}/calendar/v3/"})
+
+
+def bench_transport(rounds: int = 5, workers: int = 8, calls: int = 4) -> None:
+    """Count TCP connections a local stand-in API server sees: per-thread httplib2 vs PooledHttp."""
+    import tempfile
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    import httplib2
+    from google.auth.credentials import AnonymousCredentials
+    from google.oauth2.credentials import Credentials
+    import gcal_api
+    import gcal_auth
+    from gcal_http import PooledHttp
+    
+    def route(path: str, headers) -> Tuple[int, Dict[str, Any]]:
+        if headers.get("Authorization") == "Bearer revoked":
+            return 401, {"error": {"code": 401, "message": "Invalid Credentials",
+                                   "errors": [{"reason": "authError"}]}}
+        if "missing" in path:
+            return 404, {"error": {"code": 404, "message": "Not Found",
+                                   "errors": [{"reason": "notFound"}]}}
+        return 200, {"kind": "calendar#events", "items": [{"id": "e1"}]}
+    
+    server = _stand_in_server(route)
+    connections = server.connections
+    gcal_api._bucket = gcal_api.TokenBucket(0, 0)  # Measure the transport, not the throttle
+    
+    failures = 0
+    
+    def check(label: str, ok: bool) -> None:
+        nonlocal failures
+        failures += not ok
+        print(f"  {'PASS' if ok else 'FAIL'}  {label}")
+    
+    def fan_out(fetch) -> List[Any]:
+        # Like list_events_multi: a new worker pool per call
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda _: [fetch() for _ in range(calls)], range(workers)))
+    
+    total = rounds * workers * calls
+    print(f"Stand-in API server, {rounds} fan-outs x {workers} threads x {calls} calls:")
+    
+    # Before: each thread builds its own service, i.e. its own httplib2.Http
+    local = threading.local()
+    
+    def legacy_fetch():
+        if not hasattr(local, "service"):
+            local.service = _stand_in_service(server, httplib2.Http())
+        return gcal_api.execute(local.service.events().list(calendarId="primary"))
+    
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fan_out(legacy_fetch)
+    legacy_time = time.perf_counter() - start
+    legacy_connections = len(connections)
+    print(f"  per-thread httplib2.Http  {legacy_connections:4d} connections for {total} calls"
+          f"   {legacy_time * 1000:7.1f} ms")
+    
+    # After: one pooled transport and one service shared by every thread
+    connections.clear()
+    http = PooledHttp(AnonymousCredentials(), pool_size=workers)
+    service = _stand_in_service(server, http)
+    
+    def pooled_fetch():
+        return gcal_api.execute(service.events().list(calendarId="primary"))
+    
+    start = time.perf_counter()
+    results = [fan_out(pooled_fetch) for _ in range(rounds)]
+    pooled_time = time.perf_counter() - start
+    print(f"  shared PooledHttp         {len(connections):4d} connections for {total} calls"
+          f"   {pooled_time * 1000:7.1f} ms")
+    
+    check("every call answered through googleapiclient",
+          all(r == {"kind": "calendar#events", "items": [{"id": "e1"}]}
+              for fan in results for thread in fan for r in thread))
+    check(f"connections reused across threads and fan-outs (<= pool size {workers})",
+          1 <= len(connections) <= workers < legacy_connections)
+    try:
+        gcal_api.execute(service.events().get(calendarId="primary", eventId="missing"))
+        error = None
+    except gcal_api.CalendarAPIError as e:
+        error = e
+    check("HTTP errors still surface as HttpError -> CalendarAPIError",
+          error is not None and error.status == 404 and error.reason == "notFound")
+    http.close()
+    
+    # A 401 makes the AuthorizedSession refresh; that must go through
+    # gcal_auth's token lock and end up in token.json
+    def stand_in_refresh(creds, request):
+        creds.token = "renewed"
+        creds.expiry = datetime.utcnow() + timedelta(hours=1)
+    
+    original_refresh = Credentials.refresh
+    Credentials.refresh = stand_in_refresh
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            gcal_auth.TOKEN_FILE = Path(tmp) / "token.json"
+            gcal_auth.TOKEN_LOCK_FILE = Path(tmp) / "token.lock"
+            creds = Credentials(token="revoked", refresh_token="refresh", client_id="id",
+                                client_secret="secret",
+                                expiry=datetime.utcnow() + timedelta(hours=1))
+            gcal_auth._route_refresh(creds)  # As build_calendar_service() does
+            auth_http = PooledHttp(creds)
+            gcal_api.execute(_stand_in_service(server, auth_http).events().list(calendarId="primary"))
+            auth_http.close()
+            saved = json.loads(gcal_auth.TOKEN_FILE.read_text()).get("token") \
+                if gcal_auth.TOKEN_FILE.exists() else None
+    finally:
+        Credentials.refresh = original_refresh
+    check("401 refresh goes through the token lock and is saved to token.json",
+          saved == "renewed")
+    
+    server.shutdown()
+    if failures:
+        sys.exit(1)
+
+
+def bench_httpcache(events: int = 250, repeats: int = 20) -> None:
+    """Repeated reads against a stand-in server honouring If-None-Match: bytes and time with the ETag cache."""
+    import tempfile
+    from google.auth.credentials import AnonymousCredentials
+    import gcal_api
+    import gcal_cache
+    from gcal_http import PooledHttp
+    
+    page = {"kind": "calendar#events", "etag": '"v1"', "items": synthetic_events(events)}
+    
+    def route(path: str, headers) -> Tuple[int, Optional[Dict[str, Any]]]:
+        if headers.get("If-None-Match") == page["etag"]:
+            return 304, None
+        return 200, page
+    
+    server = _stand_in_server(route)
+    http = PooledHttp(AnonymousCredentials())
+    service = _stand_in_service(server, http)
+    gcal_api._bucket = gcal_api.TokenBucket(0, 0)
+    
+    failures = 0
+    
+    def check(label: str, ok: bool) -> None:
+        nonlocal failures
+        failures += not ok
+        print(f"  {'PASS' if ok else 'FAIL'}  {label}")
+    
+    def timed_reads(cache: bool) -> Tuple[List[float], int, Any]:
+        server.body_bytes = 0
+        timings, result = [], None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = gcal_api.execute(service.events().list(calendarId="primary"), cache=cache)
+            timings.append(time.perf_counter() - start)
+        return timings, server.body_bytes, result
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        gcal_cache.CACHE_FILE = Path(tmp) / "http_cache.db"
+        
+        print(f"Repeated events().list of {events} events ({repeats} reads):")
+        plain, plain_bytes, _ = timed_reads(cache=False)
+        _report(f"no cache ({plain_bytes // repeats} B/read)", plain)
+        cached, cached_bytes, result = timed_reads(cache=True)
+        _report(f"ETag cache ({cached_bytes // repeats} B/read)", cached[1:])
+        
+        gcal_cache._memory.clear()  # As in a fresh CLI process
+        server.body_bytes = 0
+        start = time.perf_counter()
+        from_disk = gcal_api.execute(service.events().list(calendarId="primary"), cache=True)
+        _report("ETag cache, fresh process", [time.perf_counter() - start])
+        
+        info = gcal_cache.stats()
+        check(f"304s served from cache ({info['hits']} hits, {info['misses']} miss)",
+              info["hits"] == repeats and info["misses"] == 1 and
+              result == page and from_disk == page and server.body_bytes == 0)
+        
+        page["etag"] = '"v2"'
+        page["items"] = page["items"][:10]
+        changed = gcal_api.execute(service.events().list(calendarId="primary"), cache=True)
+        check("changed resource refetched (ETag mismatch -> 200)",
+              changed == page and gcal_cache.stats()["misses"] == 2)
+        
+        gcal_cache.CACHE_MAX_BYTES = 2 * len(json.dumps(page, separators=(",", ":")))
+        for calendar_id in ("a", "b", "c"):
+            gcal_api.execute(service.events().list(calendarId=calendar_id), cache=True)
+        info = gcal_cache.stats()
+        check(f"LRU keeps the cache within its size bound ({info['entries']} entries, "
+              f"{info['evictions']} evicted)",
+              info["bytes"] <= gcal_cache.CACHE_MAX_BYTES and info["evictions"] >= 2)
+    
+    http.close()
+    server.shutdown()
+    if failures:
+        sys.exit(1)
+
+
+class _FakeResponse(dict):
+    """httplib2.Response stand-in: headers plus a status attribute."""
+    
+    def __init__(self, status: int, headers: Dict[str, str] = None):
+        super().__init__(headers or {})
+        self.status = status
+
+
+class _FakeHttpError(Exception):
+    """HttpError stand-in carrying a Google JSON error body."""
+    
+    def __init__(self, status: int, reason: str = "backendError", headers: Dict[str, str] = None):
+        super().__init__(f"HTTP {status}")
+        self.resp = _FakeResponse(status, headers)
+        self.content = json.dumps({"error": {"errors": [{"reason": reason}],
+                                             "message": reason}}).encode("utf-8")
+
+
+class _ScriptedRequest:
+    """Request whose execute() raises the scripted errors in order, then succeeds."""
+    
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+    
+    def execute(self) -> Dict[str, Any]:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"ok": True}
+
+
+def bench_store(count: int = 200000, runs: int = 20) -> None:
+    """Time one-day range queries on the local event store near both ends of its window."""
+    import tempfile
+    import gcal_sync
+    
+    now = datetime.now(timezone.utc)
+    first = now - timedelta(days=gcal_sync.SYNC_LOOKBACK_DAYS)
+    span = timedelta(days=gcal_sync.SYNC_LOOKBACK_DAYS + gcal_sync.SYNC_LOOKAHEAD_DAYS)
+    items = []
+    for i in range(count):
+        start = first + span * i / count
+        items.append({"id": f"evt{i:06d}", "summary": f"Meeting {i}", "status": "confirmed",
+                      "start": {"dateTime": start.isoformat()},
+                      "end": {"dateTime": (start + timedelta(minutes=45)).isoformat()}})
+    # A three-day conference, so the lower bound has to reach back past it
+    conference = now + timedelta(days=200)
+    items.append({"id": "conference", "summary": "Conference", "status": "confirmed",
+                  "start": {"dateTime": conference.isoformat()},
+                  "end": {"dateTime": (conference + timedelta(days=3)).isoformat()}})
+    
+    class _Page:
+        def execute(self):
+            return {"items": items, "nextSyncToken": "bench"}
+    
+    class _Events:
+        def list(self, **params):
+            return _Page()
+    
+    class _Service:
+        def events(self):
+            return _Events()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        gcal_sync.STORE_FILE = Path(tmp) / "events.db"
+        gcal_sync.full_sync(_Service(), "primary")
+        print(f"One-day query_events() on a store of {count} events:")
+        for label, day in (("near window start", first + timedelta(days=2)),
+                           ("near window end", first + span - timedelta(days=5))):
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                gcal_sync.query_events("primary", day, day + timedelta(days=1))
+                timings.append(time.perf_counter() - start)
+            _report(label, timings)
+        inside = conference + timedelta(days=2)
+        found = gcal_sync.query_events("primary", inside, inside + timedelta(hours=1))
+        ok = any(e["id"] == "conference" for e in found)
+        print(f"  {'PASS' if ok else 'FAIL'}  multi-day event found from its third day")
+        if not ok:
+            sys.exit(1)
+
+
+def bench_freebusy() -> None:
+    """Check free-slot search around window edges with a buffer (no network)."""
+    from datetime import time as dt_time
+    from gcal_freebusy import BusyIndex
+    
+    day = datetime(2026, 1, 5, tzinfo=timezone(timedelta(hours=-5)))  # A Monday
+    
+    def at(hour: int, minute: int = 0) -> datetime:
+        return day.replace(hour=hour, minute=minute)
+    
+    failures = 0
+    
+    def check(label: str, ok: bool) -> None:
+        nonlocal failures
+        failures += not ok
+        print(f"  {'PASS' if ok else 'FAIL'}  {label}")
+    
+    print("Free-slot search (30 minutes, 15-minute buffer):")
+    edges = BusyIndex([(at(8), at(8, 55)), (at(17, 5), at(18))])
+    slots = edges.free_slots(day, day + timedelta(days=1), duration_minutes=30, buffer_minutes=15,
+                             working_hours=(dt_time(9), dt_time(17)))
+    check("meeting ending 08:55 moves a 09:00 working-hours start to 09:10",
+          slots[0][0] == at(9, 10))
+    check("meeting starting 17:05 moves a 17:00 working-hours end to 16:50",
+          slots[-1][1] == at(16, 50))
+    check("same at time_min/time_max without working hours",
+          edges.free_slots(at(9), at(17), 30, 15) == [(at(9, 10), at(16, 50))])
+    check("busy time inside the window is buffered on both sides",
+          BusyIndex([(at(12), at(13))]).free_slots(at(9), at(17), 30, 15) ==
+          [(at(9), at(11, 45)), (at(13, 15), at(17))])
+    check("busy time more than a buffer outside leaves the window alone",
+          BusyIndex([(at(8), at(8, 40)), (at(17, 20), at(18))]).free_slots(at(9), at(17), 30, 15) ==
+          [(at(9), at(17))])
+    check("is_free agrees at the edges",
+          not edges.is_free(at(9), at(9, 30), 15) and edges.is_free(at(9, 10), at(9, 40), 15))
+    
+    if failures:
+        sys.exit(1)
+
+
+def bench_retry() -> None:
+    """Check gcal_api's retry, throttling and circuit-breaker behaviour (no network, no sleeping)."""
+    import gcal_api
+    
+    slept: List[float] = []
+    
+    def run(request: _ScriptedRequest, retries: int = gcal_api.MAX_RETRIES) -> Any:
+        gcal_api._breaker = gcal_api.CircuitBreaker(gcal_api.BREAKER_THRESHOLD,
+                                                    gcal_api.BREAKER_RESET_SECONDS)
+        slept.clear()
+        try:
+            return gcal_api.execute(request, retries=retries, sleep=slept.append)
+        except gcal_api.CalendarAPIError as e:
+            return e
+    
+    failures = 0
+    
+    def check(label: str, ok: bool) -> None:
+        nonlocal failures
+        failures += not ok
+        print(f"  {'PASS' if ok else 'FAIL'}  {label}")
+    
+    gcal_api._bucket = gcal_api.TokenBucket(0, 0)  # Throttling is checked separately
+    print("Request executor:")
+    
+    request = _ScriptedRequest(_FakeHttpError(503), _FakeHttpError(500))
+    result = run(request)
+    check(f"5xx retried with jittered backoff (slept {', '.join(f'{s:.2f}s' for s in slept)})",
+          result == {"ok": True} and request.calls == 3 and
+          0 <= slept[0] <= gcal_api.BACKOFF_BASE_SECONDS and
+          0 <= slept[1] <= gcal_api.BACKOFF_BASE_SECONDS * 2)
+    
+    result = run(_ScriptedRequest(_FakeHttpError(429, "rateLimitExceeded", {"retry-after": "7"})))
+    check("429 honours Retry-After", result == {"ok": True} and slept and slept[0] >= 7)
+    
+    result = run(_ScriptedRequest(_FakeHttpError(403, "userRateLimitExceeded")))
+    check("403 userRateLimitExceeded retried", result == {"ok": True} and len(slept) == 1)
+    
+    result = run(_ScriptedRequest(ConnectionResetError("reset by peer")))
+    check("network error retried", result == {"ok": True} and len(slept) == 1)
+    
+    request = _ScriptedRequest(_FakeHttpError(404, "notFound"))
+    result = run(request)
+    check("404 raised at once as a structured error",
+          isinstance(result, gcal_api.CalendarAPIError) and request.calls == 1 and
+          result.to_dict() == {"message": "HTTP 404: notFound", "status": 404,
+                               "reason": "notFound", "retryable": False})
+    
+    request = _ScriptedRequest(*[_FakeHttpError(503) for _ in range(4)])
+    result = run(request, retries=2)
+    check("gives up after the retry budget",
+          isinstance(result, gcal_api.CalendarAPIError) and result.retryable and request.calls == 3)
+    
+    request = _ScriptedRequest(*[_FakeHttpError(503) for _ in range(10)])
+    run(request)
+    followup = _ScriptedRequest()
+    result = None
+    try:
+        gcal_api.execute(followup, sleep=slept.append)
+    except gcal_api.CircuitOpenError as e:
+        result = e
+    check(f"circuit opens after {gcal_api.BREAKER_THRESHOLD} failures and fails fast",
+          request.calls == gcal_api.BREAKER_THRESHOLD and isinstance(result, gcal_api.CircuitOpenError)
+          and followup.calls == 0)
+    
+    bucket = gcal_api.TokenBucket(gcal_api.REQUESTS_PER_SECOND, gcal_api.BURST_REQUESTS)
+    # No time passes, so each wait is measured from the same instant
+    waits = [bucket.acquire(sleep=lambda s: None) for _ in range(gcal_api.BURST_REQUESTS * 2)]
+    expected = gcal_api.BURST_REQUESTS / gcal_api.REQUESTS_PER_SECOND
+    check(f"token bucket: {len(waits)} requests finish after {waits[-1]:.2f}s "
+          f"(burst {gcal_api.BURST_REQUESTS}, {gcal_api.REQUESTS_PER_SECOND:g}/s)",
+          not any(waits[:gcal_api.BURST_REQUESTS]) and abs(waits[-1] - expected) < 0.1)
+    
+    if failures:
+        sys.exit(1)
+
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="gcal-pro benchmarks")
+    parser.add_argument("benchmark", choices=["startup", "importtime", "parse", "memory", "nlparse",
+                                                  "watch", "retry", "license", "transport",
+                                                  "httpcache", "fields", "freebusy", "store"],
+                        help="Benchmark to run")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Repetitions per measurement")
+    parser.add_argument("--events", type=int, default=10000,
+                        help="Synthetic events for parse/memory/store (default: 10000)")
+    
+    args = parser.parse_args()
+    # Keep get_timezone() from looking up the Calendar setting over the network
+    os.environ.setdefault("GCAL_PRO_TIMEZONE", "America/New_York")
+    
+    if args.benchmark == "startup":
+        bench_startup(runs=args.runs)
+    
+    elif args.benchmark == "importtime":
+        bench_importtime(runs=args.runs)
+    
+    elif args.benchmark == "parse":
+        bench_parse(count=args.events, runs=args.runs)
+    
+    elif args.benchmark == "memory":
+        bench_memory(count=args.events)
+    
+    elif args.benchmark == "nlparse":
+        bench_nlparse(runs=args.runs)
+    
+    elif args.benchmark == "watch":
+        bench_watch()
+    
+    elif args.benchmark == "retry":
+        bench_retry()
+    
+    elif args.benchmark == "license":
+        bench_license(runs=args.runs)
+    
+    elif args.benchmark == "transport":
+        bench_transport()
+    
+    elif args.benchmark == "httpcache":
+        bench_httpcache()
+    
+    elif args.benchmark == "fields":
+        bench_fields(count=args.events, runs=args.runs)
+    
+    elif args.benchmark == "freebusy":
+        bench_freebusy()
+    
+    elif args.benchmark == "store":
+        bench_store(count=args.events, runs=args.runs)
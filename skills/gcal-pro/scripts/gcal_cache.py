@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: HTTP Response Cache
+Stores GET responses with their ETags so repeated reads are revalidated
+with If-None-Match; a 304 Not Modified answer is served from the cache
+without transferring or re-parsing the body.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Tuple
+
+from gcal_auth import CONFIG_DIR, get_config_dir
+
+CACHE_FILE = CONFIG_DIR / "http_cache.db"
+
+# Total size of stored response bodies; least recently used entries are
+# evicted beyond this
+CACHE_MAX_BYTES = int(float(os.environ.get("GCAL_PRO_HTTP_CACHE_MB", "20")) * 1024 * 1024)
+
+# Parsed responses also kept in memory, so a 304 in a long-running process
+# (gcal_daemon) skips JSON parsing as well
+MEMORY_ENTRIES = 128
+
+# Bump when the schema changes; the cache is rebuilt
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key     TEXT PRIMARY KEY,
+    etag    TEXT NOT NULL,
+    body    TEXT NOT NULL,
+    size    INTEGER NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used ON responses (used_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_memory: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating the schema on first use."""
+    get_config_dir()
+    conn = sqlite3.connect(str(CACHE_FILE), timeout=30)
+    conn.execute("PRAGMA journal_mode = WAL")
+    # Losing the last few entries on power loss is fine for a cache
+    conn.execute("PRAGMA synchronous = NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript("DROP TABLE IF EXISTS responses; DROP TABLE IF EXISTS counters;")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(_SCHEMA)
+    # Running total of stored body sizes ("bytes" counter), kept in step by
+    # store() and _evict() so the size check never has to scan the table
+    if conn.execute("SELECT 1 FROM counters WHERE name = 'bytes'").fetchone() is None:
+        conn.execute("INSERT OR IGNORE INTO counters (name, value) "
+                     "SELECT 'bytes', COALESCE(SUM(size), 0) FROM responses")
+        conn.commit()
+    return conn
+
+
+@contextmanager
+def _cache():
+    """Yield a cache connection that commits on success and is always closed."""
+    conn = _connect()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _count(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+    """Add to a persistent counter."""
+    conn.execute(
+        "INSERT INTO counters (name, value) VALUES (?, ?) "
+        "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+        (name, amount)
+    )
+
+
+def _remember(key: str, etag: str, value: Any) -> None:
+    """Keep a parsed response in the in-memory LRU."""
+    with _memory_lock:
+        _memory[key] = (etag, value)
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def lookup(key: str) -> Optional[str]:
+    """
+    ETag to revalidate a cached response with, or None if nothing is cached.
+    
+    Args:
+        key: Request URI (including the query string)
+    """
+    with _memory_lock:
+        cached = _memory.get(key)
+    if cached is not None:
+        return cached[0]
+    try:
+        with _cache() as conn:
+            row = conn.execute("SELECT etag FROM responses WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def revalidated(key: str, etag: str) -> Optional[Any]:
+    """
+    Return the cached response after a 304 for `etag`, and count a hit.
+    
+    Returns:
+        The parsed response, or None if the entry is gone or has a different
+        ETag by now (another process replaced or evicted it)
+    """
+    with _memory_lock:
+        cached = _memory.get(key)
+    value = cached[1] if cached is not None and cached[0] == etag else None
+    try:
+        with _cache() as conn:
+            if value is None:
+                row = conn.execute(
+                    "SELECT body FROM responses WHERE key = ? AND etag = ?", (key, etag)
+                ).fetchone()
+                if row is None:
+                    return None
+                value = json.loads(row[0])
+            conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+            _count(conn, "hits")
+    except sqlite3.Error:
+        if value is None:
+            return None
+    _remember(key, etag, value)
+    return value
+
+
+def store(key: str, value: Any) -> None:
+    """
+    Cache a full (200) response, and count a miss.
+    
+    Responses without an "etag" field cannot be revalidated and are only
+    counted. Least recently used entries are evicted to stay within
+    CACHE_MAX_BYTES.
+    """
+    etag = value.get("etag") if isinstance(value, dict) else None
+    try:
+        with _cache() as conn:
+            _count(conn, "misses")
+            if not etag:
+                return
+            body = json.dumps(value, separators=(",", ":"))
+            if len(body) > CACHE_MAX_BYTES:
+                return
+            replaced = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body, size, used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, etag, body, len(body), time.time())
+            )
+            _count(conn, "bytes", len(body) - (replaced[0] if replaced else 0))
+            _evict(conn)
+    except sqlite3.Error:
+        return
+    _remember(key, etag, value)
+
+
+def _evict(conn: sqlite3.Connection) -> None:
+    """Drop least recently used entries until the cache fits CACHE_MAX_BYTES."""
+    excess = conn.execute("SELECT value FROM counters WHERE name = 'bytes'").fetchone()[0] \
+        - CACHE_MAX_BYTES
+    if excess <= 0:
+        return
+    victims = []
+    freed = 0
+    for key, size in conn.execute("SELECT key, size FROM responses ORDER BY used_at"):
+        victims.append((key,))
+        freed += size
+        if freed >= excess:
+            break
+    conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+    _count(conn, "bytes", -freed)
+    _count(conn, "evictions", len(victims))
+    with _memory_lock:
+        for (key,) in victims:
+            _memory.pop(key, None)
+
+
+def stats() -> Dict[str, Any]:
+    """Entry count, size and hit/miss/eviction counters (across all processes)."""
+    with _cache() as conn:
+        entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        counters = dict(conn.execute("SELECT name, value FROM counters"))
+    hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+    return {
+        "entries": entries,
+        "bytes": counters.get("bytes", 0),
+        "max_bytes": CACHE_MAX_BYTES,
+        "hits": hits,
+        "misses": misses,
+        "evictions": counters.get("evictions", 0),
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0
+    }
+
+
+def clear() -> None:
+    """Drop every cached response and reset the counters."""
+    with _memory_lock:
+        _memory.clear()
+    with _cache() as conn:
+        conn.execute("DELETE FROM responses")
+        conn.execute("DELETE FROM counters")
+
+
+def format_stats(info: Dict[str, Any]) -> str:
+    """Human-readable cache statistics."""
+    return "\n".join([
+        f"Cache:     {CACHE_FILE}",
+        f"Entries:   {info['entries']} ({info['bytes'] / 1024:.1f} KiB of "
+        f"{info['max_bytes'] / 1024 / 1024:.0f} MiB)",
+        f"Hits:      {info['hits']} (304 Not Modified)",
+        f"Misses:    {info['misses']}",
+        f"Hit rate:  {info['hit_rate']:.0%}",
+        f"Evictions: {info['evictions']}"
+    ])
+
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="gcal-pro HTTP response cache")
+    parser.add_argument("command", choices=["stats", "clear"], help="Cache command")
+    
+    args = parser.parse_args()
+    
+    if args.command == "stats":
+        print(format_stats(stats()))
+    
+    elif args.command == "clear":
+        clear()
+        print("[OK] HTTP cache cleared.")
@@ -4,24 +4,142 @@ gcal-pro: Core Calendar Operations Module
 Handles all Google Calendar API operations with timezone awareness.
 """
 
+import heapq
+import json
+import os
 import sys
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
-from zoneinfo import ZoneInfo
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, time as dt_time
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Sequence
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from dateutil import parser as date_parser
-from dateutil.relativedelta import relativedelta
+from gcal_auth import CONFIG_DIR, get_calendar_service, is_pro_user, load_config
+import gcal_api
+from gcal_api import CalendarAPIError
+import gcal_dates
+import gcal_sync
+from gcal_freebusy import BusyIndex, WORKDAYS, query_freebusy
 
-from gcal_auth import get_calendar_service, is_pro_user
-
-# Default timezone (can be overridden)
+# Default timezone, used when none is configured or detected (see get_timezone)
 DEFAULT_TIMEZONE = "America/New_York"
+# Timezones detected from the Calendar API, so later runs need no lookup
+TIMEZONE_CACHE_FILE = CONFIG_DIR / "timezones.json"
+
+# events().list page sizes: API default and maximum
+DEFAULT_PAGE_SIZE = 250
+MAX_PAGE_SIZE = 2500
+
+# Concurrent calendar fetches in list_events_multi()
+MAX_FETCH_WORKERS = 8
+
+# Partial-response masks (fields=) covering exactly what _parse_event and
+# list_calendars read; conference data, reminders, attendee details etc.
+# are never downloaded. Pass fields=None to the read functions for full resources.
+EVENT_FIELDS = ("id,etag,status,summary,description,location,htmlLink,"
+                "start(date,dateTime),end(date,dateTime),attendees(email),organizer(email)")
+CALENDAR_FIELDS = "etag,nextPageToken,items(id,summary,primary,accessRole,timeZone)"
+
+# Precomputed morning brief written by `brief --precompute`
+BRIEF_FILE = CONFIG_DIR / "brief.json"
+# How long (seconds) a precomputed brief is served before regenerating
+BRIEF_MAX_AGE_SECONDS = int(os.environ.get("GCAL_PRO_BRIEF_TTL", "1800"))
+
+# How long (seconds) the local event index is trusted before syncing again
+CACHE_TTL_SECONDS = int(os.environ.get("GCAL_PRO_CACHE_TTL", "300"))
+
+# Busy-interval indexes built by _busy_index():
+# (key, start, end, built_at, store generation, index)
+_busy_cache: List[Tuple[tuple, datetime, datetime, float, int, BusyIndex]] = []
+
+
+def _zone(name: Optional[str], source: str) -> Optional[ZoneInfo]:
+    """Build a ZoneInfo, warning about (and skipping) unknown names."""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        print(f"Warning: unknown timezone {name!r} in {source}")
+        return None
+
+
+def _detected_timezones() -> Dict[str, Any]:
+    """Timezones previously detected from the API ({"user": ..., "calendars": {...}})."""
+    try:
+        return json.loads(TIMEZONE_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
 
+def _remember_timezones(user: str = None, calendars: Dict[str, str] = None) -> None:
+    """Merge detected timezones into TIMEZONE_CACHE_FILE."""
+    detected = _detected_timezones()
+    if user:
+        detected["user"] = user
+    if calendars:
+        detected.setdefault("calendars", {}).update(calendars)
+    try:
+        TIMEZONE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = TIMEZONE_CACHE_FILE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(detected), encoding="utf-8")
+        os.replace(tmp_path, TIMEZONE_CACHE_FILE)
+    except OSError:
+        pass  # Detection is repeated next run
+    get_calendar_timezone.cache_clear()
 
+
+def _fetch_user_timezone() -> Optional[str]:
+    """Read the user's Calendar "timezone" setting and remember it."""
+    service = get_calendar_service()
+    if not service:
+        return None
+    try:
+        # Only one retry: there is a fallback, and this runs before most commands
+        name = gcal_api.execute(service.settings().get(setting="timezone"), retries=1).get("value")
+    except CalendarAPIError as e:
+        print(f"Warning: could not read Calendar timezone setting: {e}")
+        return None
+    _remember_timezones(user=name)
+    return name
+
+
+@lru_cache(maxsize=None)
 def get_timezone() -> ZoneInfo:
-    """Get the configured timezone."""
-    # Could be extended to read from config
-    return ZoneInfo(DEFAULT_TIMEZONE)
+    """
+    Get the user's timezone (resolved once per process).
+    
+    Uses the first of: GCAL_PRO_TIMEZONE, "timezone" in config.json, the
+    Calendar "timezone" setting (looked up once, then remembered in
+    timezones.json), DEFAULT_TIMEZONE.
+    """
+    return (
+        _zone(os.environ.get("GCAL_PRO_TIMEZONE"), "GCAL_PRO_TIMEZONE")
+        or _zone(load_config().get("timezone"), "config.json")
+        or _zone(_detected_timezones().get("user") or _fetch_user_timezone(),
+                 "Calendar settings")
+        or ZoneInfo(DEFAULT_TIMEZONE)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_calendar_timezone(calendar_id: Optional[str]) -> ZoneInfo:
+    """
+    Get the timezone of a calendar (resolved once per calendar).
+    
+    Uses "calendar_timezones" in config.json, then the calendar's own
+    timezone as reported by list_calendars(), then get_timezone().
+    """
+    if calendar_id and calendar_id != "primary":
+        override = load_config().get("calendar_timezones", {}).get(calendar_id)
+        detected = _detected_timezones().get("calendars", {}).get(calendar_id)
+        zone = _zone(override, "config.json") or _zone(detected, "calendar list")
+        if zone:
+            return zone
+    return get_timezone()
 
 
 def now_local() -> datetime:
@@ -43,6 +161,10 @@ def parse_datetime(text: str, reference: datetime = None) -> datetime:
     """
     Parse natural language datetime string.
     
+    Common phrases ("tomorrow 2pm", "next Friday", "in 2 hours", "eod") go
+    through gcal_dates' rule table, anything else through dateutil's fuzzy
+    parser; results are memoized per reference day.
+    
     Args:
         text: Natural language date/time (e.g., "tomorrow 2pm", "next Friday")
         reference: Reference datetime for relative parsing
@@ -52,27 +174,129 @@ def parse_datetime(text: str, reference: datetime = None) -> datetime:
     """
     if reference is None:
         reference = now_local()
+    elif reference.tzinfo is None:
+        reference = reference.replace(tzinfo=get_timezone())
+    return gcal_dates.parse_datetime(text, reference)
+
+
+# =============================================================================
+# EVENT MODEL
+# =============================================================================
+
+class Event(Mapping):
+    """
+    A parsed calendar event.
     
-    tz = get_timezone()
+    Stored in __slots__ instead of a per-event dict. start_dt/end_dt are
+    parsed from the start/end strings on first access, and attendee emails
+    are only extracted from the API attendee list when asked for.
     
-    # Handle common relative terms
-    text_lower = text.lower().strip()
+    Behaves as a read-only mapping over EVENT_KEYS (event["summary"],
+    event.get("start_dt")), so code written against the old dicts keeps
+    working; to_dict() returns a plain dict.
+    """
     
-    if text_lower == "today":
-        return reference.replace(hour=9, minute=0, second=0, microsecond=0)
-    elif text_lower == "tomorrow":
-        return (reference + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
-    elif text_lower == "next week":
-        return (reference + timedelta(weeks=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+    __slots__ = (
+        "id", "summary", "description", "location", "start", "end", "all_day",
+        "html_link", "status", "organizer", "etag", "calendar_id",
+        "_start_dt", "_end_dt", "_attendees", "_raw_attendees"
+    )
     
-    # Use dateutil parser for everything else
-    try:
-        parsed = date_parser.parse(text, fuzzy=True, default=reference)
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=tz)
-        return parsed
-    except Exception:
-        raise ValueError(f"Could not parse datetime: {text}")
+    def __init__(
+        self,
+        id: str = None,
+        summary: str = "(No title)",
+        description: str = None,
+        location: str = None,
+        start: str = None,
+        end: str = None,
+        all_day: bool = False,
+        attendees: List[str] = None,
+        raw_attendees: List[Dict[str, Any]] = None,
+        html_link: str = None,
+        status: str = None,
+        organizer: str = None,
+        etag: str = None,
+        calendar_id: str = None
+    ):
+        self.id = id
+        self.summary = summary
+        self.description = description
+        self.location = location
+        self.start = start
+        self.end = end
+        self.all_day = all_day
+        self.html_link = html_link
+        self.status = status
+        self.organizer = organizer
+        self.etag = etag
+        self.calendar_id = calendar_id
+        self._start_dt = self._end_dt = None
+        self._attendees = attendees
+        self._raw_attendees = raw_attendees
+    
+    @property
+    def start_dt(self) -> Optional[datetime]:
+        if self._start_dt is None and self.start:
+            self._start_dt = self._parse(self.start)
+        return self._start_dt
+    
+    @property
+    def end_dt(self) -> Optional[datetime]:
+        if self._end_dt is None and self.end:
+            self._end_dt = self._parse(self.end)
+        return self._end_dt
+    
+    @property
+    def attendees(self) -> List[str]:
+        if self._attendees is None:
+            self._attendees = [a.get("email") for a in self._raw_attendees or ()]
+            self._raw_attendees = None
+        return self._attendees
+    
+    def _parse(self, value: str) -> datetime:
+        return _parse_time({"date" if self.all_day else "dateTime": value},
+                           get_calendar_timezone(self.calendar_id))
+    
+    # Mapping interface (backward compatibility with event dicts)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in EVENT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(EVENT_KEYS)
+    
+    def __len__(self) -> int:
+        return len(EVENT_KEYS)
+    
+    def __repr__(self) -> str:
+        return f"Event(id={self.id!r}, summary={self.summary!r}, start={self.start!r})"
+    
+    def to_dict(self, datetimes: bool = True) -> Dict[str, Any]:
+        """
+        Return the event as a plain dict.
+        
+        Args:
+            datetimes: Include start_dt/end_dt (False gives a JSON-serializable record)
+        """
+        keys = EVENT_KEYS if datetimes else _RECORD_KEYS
+        return {key: getattr(self, key) for key in keys}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        """Rebuild an event from to_dict() output (start_dt/end_dt are re-derived)."""
+        return cls(**{key: data.get(key) for key in _RECORD_KEYS if key in data})
+
+
+# Keys exposed by Event's mapping interface, in the order of the old dicts
+EVENT_KEYS = (
+    "id", "summary", "description", "location", "start", "end", "start_dt",
+    "end_dt", "all_day", "attendees", "html_link", "status", "organizer", "etag",
+    "calendar_id"
+)
+_RECORD_KEYS = tuple(key for key in EVENT_KEYS if key not in ("start_dt", "end_dt"))
 
 
 # =============================================================================
@@ -83,191 +307,533 @@ def list_events(
     time_min: datetime = None,
     time_max: datetime = None,
     max_results: int = 10,
-    calendar_id: str = "primary"
-) -> List[Dict[str, Any]]:
+    calendar_id: str = "primary",
+    refresh: bool = False,
+    fields: Optional[str] = EVENT_FIELDS
+) -> List[Event]:
     """
     List calendar events within a time range.
     
+    Served from the local event index when it is fresh (synced within
+    CACHE_TTL_SECONDS) and covers the range; a stale index is synced
+    first, and the API is queried directly if that is not possible.
+    
     Args:
         time_min: Start of range (default: now)
         time_max: End of range (default: end of today)
-        max_results: Maximum events to return
+        max_results: Maximum events to return (None: all)
         calendar_id: Calendar ID (default: primary)
+        refresh: Bypass the local index and query the API
+        fields: Per-event fields mask for API requests (None: full resources)
         
     Returns:
         List of event dictionaries
+        
+    Raises:
+        CalendarAPIError: If the API cannot be reached (an empty list always
+            means there are no events)
     """
-    service = get_calendar_service()
-    if not service:
-        return []
-    
     if time_min is None:
         time_min = now_local()
     if time_max is None:
         time_max = time_min.replace(hour=23, minute=59, second=59)
     
-    try:
-        events_result = service.events().list(
-            calendarId=calendar_id,
-            timeMin=format_datetime_iso(time_min),
-            timeMax=format_datetime_iso(time_max),
-            maxResults=max_results,
-            singleEvents=True,
-            orderBy="startTime"
-        ).execute()
+    if not refresh:
+        events = _list_indexed_events(time_min, time_max, max_results, calendar_id)
+        if events is not None:
+            return events
+    
+    page_size = min(max_results or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+    return list(islice(
+        iter_events(time_min, time_max, calendar_id=calendar_id, page_size=page_size,
+                    fields=fields),
+        max_results
+    ))
+
+
+def iter_events(
+    time_min: datetime,
+    time_max: datetime,
+    calendar_id: str = "primary",
+    page_size: int = DEFAULT_PAGE_SIZE,
+    query: str = None,
+    fields: Optional[str] = EVENT_FIELDS
+) -> Iterator[Event]:
+    """
+    Stream events from the API in start-time order, one page at a time.
+    
+    Pages are only requested as the caller consumes events, so stopping
+    early (e.g. with itertools.islice) skips the remaining requests.
+    
+    Args:
+        time_min: Start of range
+        time_max: End of range
+        calendar_id: Calendar ID (default: primary)
+        page_size: Events per request (capped at the API maximum of 2500)
+        query: Free-text filter passed to the API as q= (optional)
+        fields: Per-event fields mask (default: what _parse_event reads;
+            None: full resources)
+            
+    Yields:
+        Event dictionaries
         
-        events = events_result.get("items", [])
-        return [_parse_event(e) for e in events]
-    except Exception as e:
-        print(f"Error listing events: {e}")
-        return []
+    Raises:
+        CalendarAPIError: If not authenticated or a page request fails
+    """
+    service = _require_service()
+    
+    params = {
+        "calendarId": calendar_id,
+        "timeMin": format_datetime_iso(time_min),
+        "timeMax": format_datetime_iso(time_max),
+        "maxResults": max(1, min(page_size, MAX_PAGE_SIZE)),
+        "singleEvents": True,
+        "orderBy": "startTime"
+    }
+    if query:
+        params["q"] = query
+    if fields:
+        params["fields"] = f"etag,nextPageToken,items({fields})"
+    
+    page_token = None
+    while True:
+        events_result = gcal_api.execute(service.events().list(pageToken=page_token, **params),
+                                         cache=True)
+        for event in events_result.get("items", []):
+            yield _parse_event(event, calendar_id)
+        page_token = events_result.get("nextPageToken")
+        if not page_token:
+            return
+
+
+def _require_service():
+    """Return the Calendar service, or raise CalendarAPIError if not authenticated."""
+    service = get_calendar_service()
+    if not service:
+        raise CalendarAPIError("Not authenticated (run gcal_auth.py auth)",
+                               reason="unauthenticated")
+    return service
+
+
+def _ensure_synced(calendar_id: str) -> bool:
+    """Sync a calendar into the local index unless it is within CACHE_TTL_SECONDS."""
+    return gcal_sync.is_fresh(calendar_id, CACHE_TTL_SECONDS) or \
+        gcal_sync.sync_calendar(calendar_id)
 
 
-def get_today() -> List[Dict[str, Any]]:
+def _index_covers(calendar_id: str, time_min: Optional[datetime],
+                  time_max: Optional[datetime]) -> bool:
+    """Sync a calendar if needed and check that its local index spans the range."""
+    # A range outside the synced window goes to the API without syncing
+    # first (a calendar that was never synced has no window yet)
+    if gcal_sync.get_sync_state(calendar_id) is not None and \
+            not gcal_sync.covers(calendar_id, time_min, time_max):
+        return False
+    return _ensure_synced(calendar_id) and gcal_sync.covers(calendar_id, time_min, time_max)
+
+
+def _list_indexed_events(
+    time_min: datetime,
+    time_max: datetime,
+    max_results: Optional[int],
+    calendar_id: str
+) -> Optional[List[Event]]:
+    """Query the local event index, or return None if it cannot answer."""
+    if not _index_covers(calendar_id, time_min, time_max):
+        return None
+    stored = gcal_sync.query_events(calendar_id, time_min, time_max, limit=max_results)
+    return [Event.from_dict(e) for e in stored]
+
+
+def _events_between(
+    start: datetime,
+    end: datetime,
+    refresh: bool = False,
+    calendar_ids: List[str] = None
+) -> List[Event]:
+    """All events in [start, end] from the primary calendar or the given calendars."""
+    if calendar_ids:
+        return list_events_multi(time_min=start, time_max=end,
+                                 calendar_ids=calendar_ids, refresh=refresh)
+    return list_events(time_min=start, time_max=end, max_results=None, refresh=refresh)
+
+
+def get_today(refresh: bool = False, calendar_ids: List[str] = None) -> List[Event]:
     """Get today's events."""
     now = now_local()
     start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     end = now.replace(hour=23, minute=59, second=59, microsecond=0)
-    return list_events(time_min=start, time_max=end, max_results=20)
+    return _events_between(start, end, refresh=refresh, calendar_ids=calendar_ids)
 
 
-def get_tomorrow() -> List[Dict[str, Any]]:
+def get_tomorrow(refresh: bool = False, calendar_ids: List[str] = None) -> List[Event]:
     """Get tomorrow's events."""
     now = now_local()
     tomorrow = now + timedelta(days=1)
     start = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
     end = tomorrow.replace(hour=23, minute=59, second=59, microsecond=0)
-    return list_events(time_min=start, time_max=end, max_results=20)
+    return _events_between(start, end, refresh=refresh, calendar_ids=calendar_ids)
 
 
-def get_week() -> List[Dict[str, Any]]:
+def get_week(refresh: bool = False, calendar_ids: List[str] = None) -> List[Event]:
     """Get this week's events (next 7 days)."""
     now = now_local()
     start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     end = start + timedelta(days=7)
-    return list_events(time_min=start, time_max=end, max_results=50)
+    return _events_between(start, end, refresh=refresh, calendar_ids=calendar_ids)
+
+
+def all_calendar_ids() -> List[str]:
+    """IDs of every calendar in the user's list ("primary" for the primary one)."""
+    return [
+        "primary" if cal.get("primary") else cal.get("id")
+        for cal in list_calendars()
+    ] or ["primary"]
 
 
-def get_event(event_id: str, calendar_id: str = "primary") -> Optional[Dict[str, Any]]:
-    """Get a specific event by ID."""
+def list_events_multi(
+    time_min: datetime = None,
+    time_max: datetime = None,
+    calendar_ids: List[str] = None,
+    refresh: bool = False,
+    max_workers: int = MAX_FETCH_WORKERS,
+    fields: Optional[str] = EVENT_FIELDS
+) -> List[Event]:
+    """
+    List events from several calendars as one timeline.
+    
+    Calendars are fetched concurrently (the workers share the service and
+    its connection pool from get_calendar_service) and the per-calendar
+    results, already sorted by start, are combined with a k-way heap merge.
+    
+    Args:
+        time_min: Start of range (default: now)
+        time_max: End of range (default: end of today)
+        calendar_ids: Calendars to include (default: all calendars)
+        refresh: Bypass the local event index and query the API
+        max_workers: Maximum concurrent fetches
+        fields: Per-event fields mask for API requests (None: full resources)
+        
+    Returns:
+        Events from all calendars ordered by start time; each has calendar_id set
+        
+    Raises:
+        CalendarAPIError: If any calendar cannot be fetched
+    """
+    if calendar_ids is None:
+        calendar_ids = all_calendar_ids()
+    
+    def fetch(calendar_id: str) -> List[Event]:
+        events = list_events(time_min=time_min, time_max=time_max, max_results=None,
+                             calendar_id=calendar_id, refresh=refresh, fields=fields)
+        for event in events:
+            event.calendar_id = calendar_id
+        return [e for e in events if e.start_dt]
+    
+    if len(calendar_ids) == 1:
+        per_calendar = [fetch(calendar_ids[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calendar_ids))) as pool:
+            per_calendar = list(pool.map(fetch, calendar_ids))
+    
+    return list(heapq.merge(*per_calendar, key=lambda e: e.start_dt))
+
+
+def get_event(
+    event_id: str,
+    calendar_id: str = "primary",
+    fields: Optional[str] = EVENT_FIELDS
+) -> Optional[Event]:
+    """Get a specific event by ID (fields: partial-response mask, None for all)."""
     service = get_calendar_service()
     if not service:
         return None
     
+    params = {"fields": fields} if fields else {}
     try:
-        event = service.events().get(
+        event = gcal_api.execute(service.events().get(
             calendarId=calendar_id,
-            eventId=event_id
-        ).execute()
-        return _parse_event(event)
-    except Exception as e:
+            eventId=event_id,
+            **params
+        ), cache=True)
+        return _parse_event(event, calendar_id)
+    except CalendarAPIError as e:
         print(f"Error getting event: {e}")
         return None
 
 
-def search_events(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-    """Search for events by text."""
-    service = get_calendar_service()
-    if not service:
-        return []
+def search_events(
+    query: str,
+    max_results: int = 10,
+    time_min: datetime = None,
+    time_max: datetime = None,
+    calendar_ids: List[str] = None,
+    refresh: bool = False,
+    fields: Optional[str] = EVENT_FIELDS
+) -> List[Event]:
+    """
+    Search for events by text.
     
-    now = now_local()
+    Uses the local full-text index over summary, description, location and
+    attendee emails of every synced calendar, best matches first. The API
+    is queried instead (primary calendar, by default 30 days back to 90
+    ahead) when refresh is set or no synced window contains the range.
     
-    try:
-        events_result = service.events().list(
-            calendarId="primary",
-            timeMin=format_datetime_iso(now - timedelta(days=30)),
-            timeMax=format_datetime_iso(now + timedelta(days=90)),
-            maxResults=max_results,
-            singleEvents=True,
-            orderBy="startTime",
-            q=query
-        ).execute()
+    Args:
+        query: Search text
+        max_results: Maximum events to return (None: all matches)
+        time_min: Only events ending after this time (default: start of the synced window)
+        time_max: Only events starting before this time (default: end of the synced window)
+        calendar_ids: Calendars to search (default: all synced calendars)
+        refresh: Bypass the local index and query the API
+        fields: Per-event fields mask for API requests (None: full resources)
         
-        events = events_result.get("items", [])
-        return [_parse_event(e) for e in events]
-    except Exception as e:
-        print(f"Error searching events: {e}")
-        return []
+    Returns:
+        List of event dictionaries
+        
+    Raises:
+        CalendarAPIError: If the API has to be queried and cannot be reached
+    """
+    if not refresh:
+        _ensure_synced("primary")
+        searchable = [c for c in (calendar_ids or gcal_sync.synced_calendars())
+                      if _index_covers(c, time_min, time_max)]
+        if searchable:
+            stored = gcal_sync.search(query, calendar_ids=searchable, time_min=time_min,
+                                      time_max=time_max, limit=max_results)
+            return [Event.from_dict(e) for e in stored]
+    
+    now = now_local()
+    return list(islice(
+        iter_events(time_min or now - timedelta(days=30),
+                    time_max or now + timedelta(days=90),
+                    page_size=max_results or DEFAULT_PAGE_SIZE, query=query, fields=fields),
+        max_results
+    ))
 
 
 def find_free_time(
     duration_minutes: int = 60,
     time_min: datetime = None,
     time_max: datetime = None,
-    calendar_id: str = "primary"
+    calendar_id: str = "primary",
+    refresh: bool = False,
+    calendar_ids: List[str] = None,
+    working_hours: Tuple[dt_time, dt_time] = None,
+    working_days: Sequence[int] = WORKDAYS,
+    buffer_minutes: int = 0,
+    include_all_day: bool = False,
+    use_freebusy: bool = False,
+    limit: int = None
 ) -> List[Tuple[datetime, datetime]]:
     """
     Find free time slots.
     
+    Busy time from all requested calendars is merged into a sorted
+    interval index that is cached for CACHE_TTL_SECONDS (or until a write
+    or sync changes events), so repeated queries (other durations, buffers
+    or hours) are answered without fetching events again.
+    
     Args:
         duration_minutes: Minimum slot duration
         time_min: Start of search range
         time_max: End of search range
+        calendar_id: Calendar ID (used when calendar_ids is not given)
+        refresh: Bypass the local event index and the busy-time cache
+        calendar_ids: Calendars whose busy time is merged
+        working_hours: (start, end) local times to search within, e.g. (time(9), time(17))
+        working_days: Weekdays searched when working_hours is set (0 = Monday)
+        buffer_minutes: Gap to keep before and after existing events
+        include_all_day: Treat all-day events as busy
+        use_freebusy: Read busy time from freebusy().query instead of events
+        limit: Maximum number of slots to return
         
     Returns:
         List of (start, end) tuples for free slots
     """
+    return find_free_slots(
+        [duration_minutes], time_min=time_min, time_max=time_max,
+        calendar_ids=calendar_ids or [calendar_id], refresh=refresh,
+        working_hours=working_hours, working_days=working_days,
+        buffer_minutes=buffer_minutes, include_all_day=include_all_day,
+        use_freebusy=use_freebusy, limit=limit
+    )[duration_minutes]
+
+
+def find_free_slots(
+    durations: List[int],
+    time_min: datetime = None,
+    time_max: datetime = None,
+    calendar_ids: List[str] = None,
+    refresh: bool = False,
+    working_hours: Tuple[dt_time, dt_time] = None,
+    working_days: Sequence[int] = WORKDAYS,
+    buffer_minutes: int = 0,
+    include_all_day: bool = False,
+    use_freebusy: bool = False,
+    limit: int = None
+) -> Dict[int, List[Tuple[datetime, datetime]]]:
+    """
+    Find free slots for several candidate meeting durations at once.
+    
+    Args:
+        durations: Candidate slot durations in minutes
+        (other arguments as for find_free_time)
+        
+    Returns:
+        Mapping of duration -> list of (start, end) tuples
+    """
     if time_min is None:
         time_min = now_local()
     if time_max is None:
         time_max = time_min + timedelta(days=7)
     
-    # Get all events in range
-    events = list_events(time_min=time_min, time_max=time_max, max_results=100)
+    busy = _busy_index(calendar_ids or ["primary"], time_min, time_max,
+                       include_all_day=include_all_day, use_freebusy=use_freebusy,
+                       refresh=refresh)
+    return {
+        duration: busy.free_slots(
+            time_min, time_max, duration_minutes=duration,
+            buffer_minutes=buffer_minutes, working_hours=working_hours,
+            working_days=working_days, limit=limit
+        )
+        for duration in durations
+    }
+
+
+def find_meeting_slots(
+    attendees: List[str],
+    duration_minutes: int = 30,
+    time_min: datetime = None,
+    time_max: datetime = None,
+    working_hours: Tuple[dt_time, dt_time] = (dt_time(9), dt_time(17)),
+    working_days: Sequence[int] = WORKDAYS,
+    buffer_minutes: int = 0,
+    include_self: bool = True,
+    limit: int = 10
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Find slots where every attendee is free.
     
-    # Find gaps
-    free_slots = []
-    current = time_min
+    Busy time for all attendees comes from a single freebusy().query
+    request (one per 50 calendars); the union of their busy intervals is
+    merged once and the common free slots are its complement.
     
-    for event in events:
-        event_start = event.get("start_dt")
-        event_end = event.get("end_dt")
+    Args:
+        attendees: Attendee emails (their calendars must be shared with you)
+        duration_minutes: Meeting length
+        time_min: Start of search range (default: now)
+        time_max: End of search range (default: 7 days later)
+        working_hours: (start, end) local times to search within (None: all day)
+        working_days: Weekdays searched when working_hours is set (0 = Monday)
+        buffer_minutes: Gap to keep before and after existing meetings
+        include_self: Also require your primary calendar to be free
+        limit: Maximum number of slots to return
         
-        if event_start and current < event_start:
-            gap = (event_start - current).total_seconds() / 60
-            if gap >= duration_minutes:
-                free_slots.append((current, event_start))
+    Returns:
+        List of (start, end) tuples for common free slots
         
-        if event_end and event_end > current:
-            current = event_end
+    Raises:
+        CalendarAPIError: If busy time cannot be fetched, including for a
+            single attendee (reason "freeBusyUnavailable")
+    """
+    if time_min is None:
+        time_min = now_local()
+    if time_max is None:
+        time_max = time_min + timedelta(days=7)
+    
+    calendar_ids = list(dict.fromkeys((["primary"] if include_self else []) + attendees))
+    busy = query_freebusy(calendar_ids, time_min, time_max)
+    return busy.free_slots(
+        time_min, time_max, duration_minutes=duration_minutes,
+        buffer_minutes=buffer_minutes, working_hours=working_hours,
+        working_days=working_days, limit=limit
+    )
+
+
+def _busy_index(
+    calendar_ids: List[str],
+    time_min: datetime,
+    time_max: datetime,
+    include_all_day: bool = False,
+    use_freebusy: bool = False,
+    refresh: bool = False
+) -> BusyIndex:
+    """Return a (cached) busy-interval index covering [time_min, time_max]."""
+    key = (tuple(calendar_ids), include_all_day, use_freebusy)
+    now = time.time()
+    # Read before building, so a sync that lands meanwhile invalidates the entry
+    generation = gcal_sync.generation()
+    
+    if not refresh:
+        for entry_key, start, end, built_at, built_generation, index in _busy_cache:
+            if entry_key == key and start <= time_min and time_max <= end and \
+                    now - built_at < CACHE_TTL_SECONDS and built_generation == generation:
+                return index
     
-    # Check remaining time after last event
-    if current < time_max:
-        gap = (time_max - current).total_seconds() / 60
-        if gap >= duration_minutes:
-            free_slots.append((current, time_max))
+    # Build for whole days so nearby windows can reuse the same index
+    start = time_min.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = time_max.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    
+    if use_freebusy:
+        index = query_freebusy(calendar_ids, start, end)
+    else:
+        events = []
+        for cal_id in calendar_ids:
+            events.extend(list_events(time_min=start, time_max=end, max_results=None,
+                                      calendar_id=cal_id, refresh=refresh))
+        index = BusyIndex.from_events(events, include_all_day=include_all_day)
     
-    return free_slots
+    _busy_cache[:] = [e for e in _busy_cache
+                      if e[0] != key and now - e[3] < CACHE_TTL_SECONDS and e[4] == generation]
+    _busy_cache.append((key, start, end, now, generation, index))
+    return index
 
 
-def list_calendars() -> List[Dict[str, Any]]:
-    """List all available calendars."""
-    service = get_calendar_service()
-    if not service:
-        return []
+def list_calendars(fields: Optional[str] = CALENDAR_FIELDS) -> List[Dict[str, Any]]:
+    """
+    List all available calendars.
     
-    try:
-        calendars_result = service.calendarList().list().execute()
-        calendars = calendars_result.get("items", [])
-        return [
-            {
-                "id": cal.get("id"),
-                "summary": cal.get("summary"),
-                "primary": cal.get("primary", False),
-                "access_role": cal.get("accessRole")
-            }
-            for cal in calendars
-        ]
-    except Exception as e:
-        print(f"Error listing calendars: {e}")
-        return []
+    Args:
+        fields: Partial-response mask (None: full calendarList entries)
+        
+    Raises:
+        CalendarAPIError: If the API cannot be reached
+    """
+    service = _require_service()
+    params = {"fields": fields} if fields else {}
+    calendars_result = gcal_api.execute(service.calendarList().list(**params), cache=True)
+    calendars = calendars_result.get("items", [])
+    _remember_timezones(calendars={
+        cal["id"]: cal["timeZone"] for cal in calendars
+        if cal.get("id") and cal.get("timeZone")
+    })
+    return [
+        {
+            "id": cal.get("id"),
+            "summary": cal.get("summary"),
+            "primary": cal.get("primary", False),
+            "access_role": cal.get("accessRole"),
+            "time_zone": cal.get("timeZone")
+        }
+        for cal in calendars
+    ]
 
 
 # =============================================================================
 # WRITE OPERATIONS (Pro Tier Only)
 # =============================================================================
 
+def _mark_changed(calendar_id: str) -> None:
+    """Invalidate everything derived from a calendar after a local write."""
+    gcal_sync.mark_stale(calendar_id)
+    _busy_cache.clear()
+    try:
+        BRIEF_FILE.unlink()
+    except OSError:
+        pass
+
+
 def _require_pro(operation: str) -> bool:
     """Check if Pro tier is required for an operation."""
     if not is_pro_user():
@@ -286,7 +852,7 @@ def create_event(
     attendees: List[str] = None,
     calendar_id: str = "primary",
     confirmed: bool = False
-) -> Optional[Dict[str, Any]]:
+) -> Optional[Event]:
     """
     Create a new calendar event.
     
@@ -316,14 +882,8 @@ def create_event(
     # Build event body
     event_body = {
         "summary": summary,
-        "start": {
-            "dateTime": format_datetime_iso(start),
-            "timeZone": str(get_timezone())
-        },
-        "end": {
-            "dateTime": format_datetime_iso(end),
-            "timeZone": str(get_timezone())
-        }
+        "start": _time_body(start),
+        "end": _time_body(end)
     }
     
     if description:
@@ -346,20 +906,21 @@ def create_event(
         # This is for CLI testing
     
     try:
-        event = service.events().insert(
+        event = gcal_api.execute(service.events().insert(
             calendarId=calendar_id,
             body=event_body,
             sendUpdates="all" if attendees else "none"
-        ).execute()
+        ))
         
         print(f"✓ Event created: {event.get('htmlLink')}")
+        _mark_changed(calendar_id)
         return _parse_event(event)
-    except Exception as e:
+    except CalendarAPIError as e:
         print(f"Error creating event: {e}")
         return None
 
 
-def quick_add(text: str, calendar_id: str = "primary") -> Optional[Dict[str, Any]]:
+def quick_add(text: str, calendar_id: str = "primary") -> Optional[Event]:
     """
     Quick add event using natural language.
     
@@ -378,16 +939,17 @@ def quick_add(text: str, calendar_id: str = "primary") -> Optional[Dict[str, Any
         return None
     
     try:
-        event = service.events().quickAdd(
+        event = gcal_api.execute(service.events().quickAdd(
             calendarId=calendar_id,
             text=text
-        ).execute()
+        ))
         
         parsed = _parse_event(event)
+        _mark_changed(calendar_id)
         print(f"✓ Event created: {parsed.get('summary')}")
         print(f"   When: {format_datetime(parsed.get('start_dt'))}")
         return parsed
-    except Exception as e:
+    except CalendarAPIError as e:
         print(f"Error in quick add: {e}")
         return None
 
@@ -400,11 +962,16 @@ def update_event(
     description: str = None,
     location: str = None,
     calendar_id: str = "primary",
-    confirmed: bool = False
-) -> Optional[Dict[str, Any]]:
+    confirmed: bool = False,
+    etag: str = None
+) -> Optional[Event]:
     """
     Update an existing event.
     
+    Only the given fields are sent (events().patch). Pass the event's
+    `etag` (from get_event / list_events) to fail instead of overwriting
+    if the event was modified in the meantime.
+    
     Args:
         event_id: ID of event to update
         summary: New title (optional)
@@ -414,6 +981,7 @@ def update_event(
         location: New location (optional)
         calendar_id: Calendar ID
         confirmed: Skip confirmation if True
+        etag: Only update if the event still has this ETag (If-Match)
         
     Returns:
         Updated event or None
@@ -425,37 +993,16 @@ def update_event(
     if not service:
         return None
     
-    # Get existing event
-    try:
-        event = service.events().get(
-            calendarId=calendar_id,
-            eventId=event_id
-        ).execute()
-    except Exception as e:
-        print(f"Event not found: {e}")
+    body = _patch_body(summary=summary, start=start, end=end,
+                       description=description, location=location)
+    if not body:
+        print("Nothing to update.")
         return None
     
-    # Apply updates
-    if summary:
-        event["summary"] = summary
-    if start:
-        event["start"] = {
-            "dateTime": format_datetime_iso(start),
-            "timeZone": str(get_timezone())
-        }
-    if end:
-        event["end"] = {
-            "dateTime": format_datetime_iso(end),
-            "timeZone": str(get_timezone())
-        }
-    if description is not None:
-        event["description"] = description
-    if location is not None:
-        event["location"] = location
-    
     # Confirmation
     if not confirmed:
-        print(f"\n✏️ Update event: {event.get('summary')}")
+        stored = gcal_sync.get_stored_event(calendar_id, event_id)
+        print(f"\n✏️ Update event: {stored.get('summary') if stored else event_id}")
         if summary:
             print(f"   New title: {summary}")
         if start:
@@ -463,17 +1010,28 @@ def update_event(
         if end:
             print(f"   New end: {format_datetime(end)}")
     
+    # Patch sends only the changed fields: no read-modify-write round-trip
+    request = service.events().patch(
+        calendarId=calendar_id,
+        eventId=event_id,
+        body=body
+    )
+    if etag:
+        request.headers["If-Match"] = etag
+    
     try:
-        updated = service.events().update(
-            calendarId=calendar_id,
-            eventId=event_id,
-            body=event
-        ).execute()
+        updated = gcal_api.execute(request)
         
         print(f"✓ Event updated")
+        _mark_changed(calendar_id)
         return _parse_event(updated)
-    except Exception as e:
-        print(f"Error updating event: {e}")
+    except CalendarAPIError as e:
+        if e.status == 412:
+            print("Event was changed by someone else since it was read (ETag mismatch).")
+        elif e.status == 404:
+            print(f"Event not found: {e}")
+        else:
+            print(f"Error updating event: {e}")
         return None
 
 
@@ -502,11 +1060,11 @@ def delete_event(
     
     # Get event details for confirmation
     try:
-        event = service.events().get(
+        event = gcal_api.execute(service.events().get(
             calendarId=calendar_id,
             eventId=event_id
-        ).execute()
-    except Exception as e:
+        ))
+    except CalendarAPIError as e:
         print(f"Event not found: {e}")
         return False
     
@@ -519,65 +1077,295 @@ def delete_event(
         print(f"\n   ⚠️ This action cannot be undone!")
     
     try:
-        service.events().delete(
+        gcal_api.execute(service.events().delete(
             calendarId=calendar_id,
             eventId=event_id
-        ).execute()
+        ))
         
         print(f"✓ Event deleted")
+        _mark_changed(calendar_id)
         return True
-    except Exception as e:
+    except CalendarAPIError as e:
         print(f"Error deleting event: {e}")
         return False
 
 
+# =============================================================================
+# BULK OPERATIONS (Pro Tier Only)
+# =============================================================================
+
+# Google's batch endpoint accepts at most 50 calls per request
+BATCH_MAX_REQUESTS = 50
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Accept a datetime or a (natural language / ISO) string."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return parse_datetime(str(value))
+
+
+def _time_body(dt: datetime) -> Dict[str, str]:
+    """Build an API start/end object for a datetime (in its own IANA zone if it has one)."""
+    zone = getattr(dt.tzinfo, "key", None) or str(get_timezone())
+    return {"dateTime": format_datetime_iso(dt), "timeZone": zone}
+
+
+def _patch_body(
+    summary: str = None,
+    start: datetime = None,
+    end: datetime = None,
+    description: str = None,
+    location: str = None
+) -> Dict[str, Any]:
+    """Build a patch body holding only the fields that change."""
+    body: Dict[str, Any] = {}
+    if summary:
+        body["summary"] = summary
+    if start:
+        body["start"] = _time_body(start)
+    if end:
+        body["end"] = _time_body(end)
+    if description is not None:
+        body["description"] = description
+    if location is not None:
+        body["location"] = location
+    return body
+
+
+def _bulk_request(service, op: Dict[str, Any]):
+    """Turn one bulk operation dict into an (unexecuted) API request."""
+    kind = op.get("op")
+    calendar_id = op.get("calendar_id", "primary")
+    
+    if kind == "create":
+        start = _to_datetime(op["start"])
+        end = _to_datetime(op.get("end")) or start + timedelta(hours=1)
+        body = {"summary": op["summary"], "start": _time_body(start), "end": _time_body(end)}
+        for field in ("description", "location"):
+            if op.get(field):
+                body[field] = op[field]
+        if op.get("attendees"):
+            body["attendees"] = [{"email": email} for email in op["attendees"]]
+        return service.events().insert(
+            calendarId=calendar_id,
+            body=body,
+            sendUpdates="all" if op.get("attendees") else "none"
+        )
+    
+    if kind == "update":
+        body = _patch_body(
+            summary=op.get("summary"),
+            start=_to_datetime(op.get("start")),
+            end=_to_datetime(op.get("end")),
+            description=op.get("description"),
+            location=op.get("location")
+        )
+        if not body:
+            raise ValueError("no fields to update")
+        request = service.events().patch(calendarId=calendar_id, eventId=op["id"], body=body)
+        if op.get("etag"):
+            request.headers["If-Match"] = op["etag"]
+        return request
+    
+    if kind == "delete":
+        return service.events().delete(calendarId=calendar_id, eventId=op["id"])
+    
+    raise ValueError(f"unknown op: {kind!r}")
+
+
+def bulk_execute(operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run create/update/delete operations through Google's batch endpoint.
+    
+    Operations are sent BATCH_MAX_REQUESTS per HTTP request. Updates use
+    events().patch, so each operation is a single call with no prior get.
+    Each batch goes through gcal_api.execute (throttled by its size), and
+    operations that individually fail with a transient error (429, 5xx)
+    are resent in a later batch after a backoff.
+    
+    Args:
+        operations: Dicts with "op" ("create", "update" or "delete") and
+            the fields of create_event / update_event ("id" for update and
+            delete, optional "calendar_id", optional "etag" for update);
+            start/end may be strings. Entries that are not dicts (e.g. a
+            JSONL line holding an array) fail as invalid operations
+            
+    Returns:
+        One result per operation, in order:
+        {"index", "op", "success", "event" (parsed, create/update), "error",
+        "error_detail" (CalendarAPIError.to_dict() for API failures)}
+    """
+    if not _require_pro("Bulk operations"):
+        return []
+    
+    service = get_calendar_service()
+    if not service:
+        return []
+    
+    results = [
+        {"index": i, "op": op.get("op") if isinstance(op, dict) else None, "success": False,
+         "event": None, "error": None, "error_detail": None}
+        for i, op in enumerate(operations)
+    ]
+    retry = set()
+    
+    def on_response(request_id, response, exception):
+        result = results[int(request_id)]
+        if exception is not None:
+            error = gcal_api.classify(exception)
+            result["error"] = str(error)
+            result["error_detail"] = error.to_dict()
+            if error.retryable:
+                retry.add(int(request_id))
+            return
+        result.update(success=True, error=None, error_detail=None)
+        if response:
+            result["event"] = _parse_event(response)
+    
+    pending = []
+    for i, op in enumerate(operations):
+        if not isinstance(op, dict):
+            results[i]["error"] = f"Invalid operation: expected a JSON object, got {type(op).__name__}"
+            continue
+        try:
+            pending.append((i, _bulk_request(service, op)))
+        except (KeyError, ValueError) as e:
+            results[i]["error"] = f"Invalid operation: {e}"
+    
+    for attempt in range(gcal_api.MAX_RETRIES + 1):
+        if attempt:
+            time.sleep(gcal_api.backoff_delay(attempt - 1))
+        retry.clear()
+        for chunk_start in range(0, len(pending), BATCH_MAX_REQUESTS):
+            chunk = pending[chunk_start:chunk_start + BATCH_MAX_REQUESTS]
+            batch = service.new_batch_http_request(callback=on_response)
+            for i, request in chunk:
+                batch.add(request, request_id=str(i))
+            try:
+                gcal_api.execute(batch, cost=len(chunk))
+            except CalendarAPIError as e:
+                # The batch itself failed (already retried); don't resend its items
+                for i, _ in chunk:
+                    retry.discard(i)
+                    if not results[i]["success"]:
+                        results[i]["error"] = results[i]["error"] or f"Batch failed: {e}"
+                        results[i]["error_detail"] = results[i]["error_detail"] or e.to_dict()
+        pending = [(i, request) for i, request in pending if i in retry]
+        if not pending:
+            break
+    
+    for calendar_id in {op.get("calendar_id", "primary") for op in operations
+                        if isinstance(op, dict)}:
+        _mark_changed(calendar_id)
+    return results
+
+
+def bulk_create(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Create many events in batches. See bulk_execute for fields and results."""
+    return bulk_execute([dict(e, op="create") for e in events])
+
+
+def bulk_update(updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Patch many events (each dict needs "id") in batches. See bulk_execute."""
+    return bulk_execute([dict(u, op="update") for u in updates])
+
+
+def bulk_delete(event_ids: List[str], calendar_id: str = "primary") -> List[Dict[str, Any]]:
+    """Delete many events in batches. See bulk_execute for results."""
+    return bulk_execute([
+        {"op": "delete", "id": event_id, "calendar_id": calendar_id}
+        for event_id in event_ids
+    ])
+
+
+def load_operations(path: str) -> List[Dict[str, Any]]:
+    """Read bulk operations from a JSONL file (one JSON object per line)."""
+    return [op for _, op in _read_operation_lines(path)]
+
+
+def _read_operation_lines(path: str) -> List[Tuple[int, Any]]:
+    """
+    Parse a bulk operations file into (line number, value) pairs.
+    
+    Values are not checked to be objects; bulk_execute reports those as
+    invalid operations, and the CLI labels them with their line number.
+    
+    Raises:
+        ValueError: If a line is not valid JSON
+    """
+    operations = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                operations.append((line_no, json.loads(line)))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: {e}")
+    return operations
+
+
 # =============================================================================
 # HELPERS
 # =============================================================================
 
-def _parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    """Parse raw API event into clean format."""
-    tz = get_timezone()
+def _parse_rfc3339(text: str) -> datetime:
+    """
+    Parse an RFC 3339 timestamp or date as returned by the API.
     
-    # Parse start time
-    start = event.get("start", {})
-    start_dt = None
-    if "dateTime" in start:
-        start_dt = date_parser.parse(start["dateTime"])
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=tz)
-    elif "date" in start:
-        # All-day event
-        start_dt = date_parser.parse(start["date"]).replace(tzinfo=tz)
+    datetime.fromisoformat handles everything the API emits (including a
+    trailing "Z") far faster than dateutil; dateutil is only the fallback
+    for anything unusual.
+    """
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        from dateutil import parser as date_parser
+        return date_parser.isoparse(text)
+
+
+def _parse_time(value: Dict[str, Any], tz: ZoneInfo = None) -> Optional[datetime]:
+    """
+    Parse an API start/end object ({"dateTime": ...} or {"date": ...}).
     
-    # Parse end time
+    `tz` (default: get_timezone()) applies to all-day dates and naive times.
+    """
+    if "dateTime" in value:
+        dt = _parse_rfc3339(value["dateTime"])
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tz or get_timezone())
+        return dt
+    elif "date" in value:
+        # All-day event
+        return _parse_rfc3339(value["date"]).replace(tzinfo=tz or get_timezone())
+    return None
+
+
+def _parse_event(event: Dict[str, Any], calendar_id: str = None) -> Event:
+    """Parse raw API event into an Event (calendar_id selects its timezone)."""
+    start = event.get("start", {})
     end = event.get("end", {})
-    end_dt = None
-    if "dateTime" in end:
-        end_dt = date_parser.parse(end["dateTime"])
-        if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=tz)
-    elif "date" in end:
-        end_dt = date_parser.parse(end["date"]).replace(tzinfo=tz)
     
-    return {
-        "id": event.get("id"),
-        "summary": event.get("summary", "(No title)"),
-        "description": event.get("description"),
-        "location": event.get("location"),
-        "start": start.get("dateTime") or start.get("date"),
-        "end": end.get("dateTime") or end.get("date"),
-        "start_dt": start_dt,
-        "end_dt": end_dt,
-        "all_day": "date" in start,
-        "attendees": [a.get("email") for a in event.get("attendees", [])],
-        "html_link": event.get("htmlLink"),
-        "status": event.get("status"),
-        "organizer": event.get("organizer", {}).get("email")
-    }
+    return Event(
+        id=event.get("id"),
+        summary=event.get("summary", "(No title)"),
+        description=event.get("description"),
+        location=event.get("location"),
+        start=start.get("dateTime") or start.get("date"),
+        end=end.get("dateTime") or end.get("date"),
+        all_day="date" in start,
+        raw_attendees=event.get("attendees"),
+        html_link=event.get("htmlLink"),
+        status=event.get("status"),
+        organizer=event.get("organizer", {}).get("email"),
+        etag=event.get("etag"),
+        calendar_id=calendar_id
+    )
 
 
-def format_events_for_display(events: List[Dict[str, Any]]) -> str:
+def format_events_for_display(events: List[Event]) -> str:
     """Format events list for chat display."""
     if not events:
         return "📭 No events found."
@@ -618,15 +1406,53 @@ def format_events_for_display(events: List[Dict[str, Any]]) -> str:
 # MORNING BRIEF (Pro Feature)
 # =============================================================================
 
-def generate_morning_brief() -> str:
+def generate_morning_brief(refresh: bool = False, calendar_ids: List[str] = None) -> str:
     """
     Generate morning brief for Clawdbot cron.
     
+    Today and tomorrow are fetched as one 48-hour window and split locally.
+    
+    Args:
+        refresh: Bypass the local event index
+        calendar_ids: Calendars to cover (default: primary only)
+        
     Returns:
-        Formatted morning brief text
+        Formatted morning brief text (a warning, never "clear", if the
+        calendar could not be read)
     """
     now = now_local()
-    today_events = get_today()
+    try:
+        events = _brief_events(now, refresh=refresh, calendar_ids=calendar_ids)
+    except CalendarAPIError as e:
+        return _brief_unavailable(now, e)
+    return _format_brief(now, events)
+
+
+def _brief_events(now: datetime, refresh: bool = False,
+                  calendar_ids: List[str] = None) -> List[Event]:
+    """Events of today and tomorrow as one 48-hour fetch."""
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return _events_between(today_start, today_start + timedelta(days=2),
+                           refresh=refresh, calendar_ids=calendar_ids)
+
+
+def _brief_unavailable(now: datetime, error: CalendarAPIError) -> str:
+    """Brief shown when events could not be fetched."""
+    return "\n".join([
+        f"☀️ **Good morning!**",
+        f"📆 {now.strftime('%A, %B %d, %Y')}",
+        "",
+        f"⚠️ Couldn't load your calendar, so today's schedule is unknown: {error.message}"
+    ])
+
+
+def _format_brief(now: datetime, events: List[Event]) -> str:
+    """Morning brief text for the events returned by _brief_events."""
+    tomorrow_start = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    
+    # Multi-day events overlap both days, as with get_today()/get_tomorrow()
+    today_events = [e for e in events if e.start_dt < tomorrow_start]
+    tomorrow_events = [e for e in events if e.end_dt > tomorrow_start]
     
     # Build brief
     lines = [f"☀️ **Good morning! Here's your day:**"]
@@ -640,50 +1466,184 @@ def generate_morning_brief() -> str:
         lines.append(format_events_for_display(today_events))
     
     # Add tomorrow preview
-    tomorrow_events = get_tomorrow()
     if tomorrow_events:
         lines.append(f"\n👀 **Tomorrow:** {len(tomorrow_events)} event(s)")
     
     return "\n".join(lines)
 
 
+def precompute_morning_brief(calendar_ids: List[str] = None, all_calendars: bool = False) -> str:
+    """
+    Generate the morning brief and store it in BRIEF_FILE.
+    
+    Meant for a background job (e.g. every 15 minutes) so that the
+    cron-triggered `brief` command can answer without any API traffic.
+    
+    Args:
+        calendar_ids: Calendars to cover (default: primary only)
+        all_calendars: Cover every calendar in the user's list (resolved now;
+            the brief records the flag, not the IDs)
+            
+    Returns:
+        Formatted morning brief text; a failed fetch is reported but not stored
+    """
+    now = now_local()
+    try:
+        events = _brief_events(now, calendar_ids=all_calendar_ids() if all_calendars
+                               else calendar_ids)
+    except CalendarAPIError as e:
+        print(f"Warning: brief not precomputed: {e}")
+        return _brief_unavailable(now, e)
+    text = _format_brief(now, events)
+    record = {
+        "date": now_local().date().isoformat(),
+        "generated_at": time.time(),
+        "calendar_ids": None if all_calendars else calendar_ids,
+        "all_calendars": all_calendars,
+        "text": text
+    }
+    try:
+        BRIEF_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = BRIEF_FILE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(record), encoding="utf-8")
+        os.replace(tmp_path, BRIEF_FILE)
+    except OSError as e:
+        print(f"Warning: could not store brief: {e}")
+    return text
+
+
+def get_morning_brief(
+    refresh: bool = False,
+    calendar_ids: List[str] = None,
+    all_calendars: bool = False
+) -> str:
+    """
+    Return the precomputed brief if it is current, else generate one.
+    
+    A stored brief is used when it was made today, for the same calendars,
+    within BRIEF_MAX_AGE_SECONDS and no event has been written since.
+    
+    Args:
+        refresh: Ignore the precomputed brief and the local event index
+        calendar_ids: Calendars to cover (default: primary only)
+        all_calendars: Cover every calendar in the user's list (only looked
+            up if the brief has to be generated)
+            
+    Returns:
+        Formatted morning brief text
+    """
+    if not refresh:
+        record = _stored_brief()
+        if record is not None and \
+                record.get("calendar_ids") == (None if all_calendars else calendar_ids) and \
+                record.get("all_calendars", False) == all_calendars and \
+                time.time() - record.get("generated_at", 0) < BRIEF_MAX_AGE_SECONDS:
+            return record["text"]
+    if all_calendars:
+        calendar_ids = all_calendar_ids()
+    return generate_morning_brief(refresh=refresh, calendar_ids=calendar_ids)
+
+
+def refresh_precomputed_brief() -> None:
+    """Regenerate the stored brief, if there is one, for the calendars it covers."""
+    try:
+        record = json.loads(BRIEF_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    if isinstance(record, dict):
+        precompute_morning_brief(calendar_ids=record.get("calendar_ids"),
+                                 all_calendars=record.get("all_calendars", False))
+
+
+def _stored_brief() -> Optional[Dict[str, Any]]:
+    """The brief stored by precompute_morning_brief today, or None."""
+    try:
+        record = json.loads(BRIEF_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or "text" not in record or \
+            record.get("date") != now_local().date().isoformat():
+        return None
+    return record
+
+
+def _parse_hours(text: str) -> Tuple[dt_time, dt_time]:
+    """Parse a working-hours range like "9-17" or "8:30-17:30"."""
+    bounds = []
+    for part in text.split("-"):
+        hour, _, minute = part.strip().partition(":")
+        bounds.append(dt_time(int(hour), int(minute or 0)))
+    return bounds[0], bounds[1]
+
+
 # CLI for testing
-if __name__ == "__main__":
+def main(argv: List[str] = None) -> None:
+    """Run a CLI command (argv defaults to sys.argv[1:]); also used by gcal_daemon."""
     import argparse
     
-    parser = argparse.ArgumentParser(description="gcal-pro calendar operations")
+    parser = argparse.ArgumentParser(prog="gcal_core.py", description="gcal-pro calendar operations")
     parser.add_argument("command", choices=[
         "today", "tomorrow", "week", "search", "brief",
-        "create", "quick", "delete", "calendars", "free"
+        "create", "quick", "delete", "calendars", "free", "meet", "bulk", "cache-stats"
     ])
     parser.add_argument("--query", "-q", help="Search query or event text")
     parser.add_argument("--id", help="Event ID for delete/update")
+    parser.add_argument("--file", "-f", help="JSONL file of operations for bulk")
     parser.add_argument("--yes", "-y", action="store_true", help="Skip confirmation")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Bypass the local event index and query the API")
+    parser.add_argument("--all", dest="all_calendars", action="store_true",
+                        help="Include every calendar (today/tomorrow/week/brief)")
+    parser.add_argument("--duration", type=int, default=60,
+                        help="Slot length in minutes for free/meet (default: 60)")
+    parser.add_argument("--buffer", type=int, default=0,
+                        help="Minutes to keep free around meetings for free/meet")
+    parser.add_argument("--hours", help="Working hours for free/meet, e.g. 9-17 (weekdays)")
+    parser.add_argument("--with", dest="attendees",
+                        help="Comma-separated attendee emails for meet")
+    parser.add_argument("--precompute", action="store_true",
+                        help="Regenerate and store the brief (for a background job)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    try:
+        _run_command(args)
+    except CalendarAPIError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def _run_command(args) -> None:
+    """Dispatch a parsed CLI command."""
+    if args.command == "brief":
+        # --all is resolved only if the brief has to be generated, so a
+        # precomputed brief is served without a calendarList request
+        if args.precompute:
+            print(precompute_morning_brief(all_calendars=args.all_calendars))
+        else:
+            print(get_morning_brief(refresh=args.refresh, all_calendars=args.all_calendars))
+        return
+    
+    calendar_ids = all_calendar_ids() if args.all_calendars else None
     
     if args.command == "today":
-        events = get_today()
+        events = get_today(refresh=args.refresh, calendar_ids=calendar_ids)
         print(format_events_for_display(events))
     
     elif args.command == "tomorrow":
-        events = get_tomorrow()
+        events = get_tomorrow(refresh=args.refresh, calendar_ids=calendar_ids)
         print(format_events_for_display(events))
     
     elif args.command == "week":
-        events = get_week()
+        events = get_week(refresh=args.refresh, calendar_ids=calendar_ids)
         print(format_events_for_display(events))
     
     elif args.command == "search":
         if not args.query:
             print("Error: --query required for search")
             sys.exit(1)
-        events = search_events(args.query)
+        events = search_events(args.query, refresh=args.refresh)
         print(format_events_for_display(events))
     
-    elif args.command == "brief":
-        print(generate_morning_brief())
-    
     elif args.command == "quick":
         if not args.query:
             print("Error: --query required for quick add")
@@ -703,12 +1663,69 @@ if __name__ == "__main__":
             print(f"  • {cal.get('summary')}{primary}")
             print(f"    ID: {cal.get('id')}")
     
+    elif args.command == "cache-stats":
+        import gcal_cache
+        print(gcal_cache.format_stats(gcal_cache.stats()))
+    
     elif args.command == "free":
-        slots = find_free_time(duration_minutes=60)
+        working_hours = _parse_hours(args.hours) if args.hours else None
+        slots = find_free_time(duration_minutes=args.duration, refresh=args.refresh,
+                               working_hours=working_hours, buffer_minutes=args.buffer,
+                               limit=10)
         if not slots:
             print("No free slots found in the next 7 days.")
         else:
-            print("Free 1-hour slots this week:")
-            for start, end in slots[:10]:
+            print(f"Free {args.duration}-minute slots this week:")
+            for start, end in slots:
                 print(f"  • {format_datetime(start)} - {format_datetime(end)}")
+    
+    elif args.command == "meet":
+        if not args.attendees:
+            print("Error: --with required for meet")
+            sys.exit(1)
+        attendees = [email.strip() for email in args.attendees.split(",") if email.strip()]
+        working_hours = _parse_hours(args.hours or "9-17")
+        slots = find_meeting_slots(attendees, duration_minutes=args.duration,
+                                   working_hours=working_hours,
+                                   buffer_minutes=args.buffer)
+        if not slots:
+            print("No common free slots found in the next 7 days.")
+        else:
+            print(f"Common {args.duration}-minute slots with {len(attendees)} attendee(s):")
+            for start, end in slots:
+                print(f"  • {format_datetime(start)} - {format_datetime(end)}")
+    
+    elif args.command == "bulk":
+        if not args.file:
+            print("Error: --file required for bulk")
+            sys.exit(1)
+        try:
+            lines = _read_operation_lines(args.file)
+        except (OSError, ValueError) as e:
+            print(f"Error reading operations: {e}")
+            sys.exit(1)
+        operations = [op for _, op in lines]
+        if not args.yes:
+            counts = {}
+            for op in operations:
+                kind = op.get("op") if isinstance(op, dict) else "invalid"
+                counts[kind] = counts.get(kind, 0) + 1
+            print(f"\n📦 Bulk operations from {args.file}:")
+            for kind, count in counts.items():
+                print(f"   {kind}: {count}")
+            print("\n   Re-run with -y to apply.")
+            sys.exit(0)
+        results = bulk_execute(operations)
+        failed = [r for r in results if not r["success"]]
+        for r in results:
+            if r["success"]:
+                target = (r["event"] or {}).get("summary") or operations[r["index"]].get("id")
+                print(f"  ✓ [line {lines[r['index']][0]}] {r['op']} {target}")
+            else:
+                print(f"  ✗ [line {lines[r['index']][0]}] {r['op'] or 'invalid'}: {r['error']}")
+        print(f"\n{len(results) - len(failed)}/{len(results)} operations succeeded")
+        sys.exit(1 if failed or not results else 0)
 
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: Resident Daemon
+Keeps the Calendar service, caches and event store warm in one process and
+serves gcal_core commands over a Unix domain socket.
+
+    python gcal_daemon.py serve          # start the daemon (foreground)
+    python gcal_daemon.py today --all    # any gcal_core command, via the daemon
+    python gcal_daemon.py stop
+
+The client half of this module imports only the standard library (plus
+gcal_auth's paths), so a request costs an interpreter start plus one
+socket round-trip. Without a running daemon the client runs the command
+in-process instead.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Dict, List
+
+from gcal_auth import CONFIG_DIR  # gcal_auth defers its Google imports
+
+SOCKET_FILE = CONFIG_DIR / "daemon.sock"
+
+# Seconds between background syncs of the calendars in the event store
+SYNC_INTERVAL_SECONDS = int(os.environ.get("GCAL_PRO_DAEMON_SYNC", "300"))
+
+# Requests and responses are single JSON objects terminated by a newline
+_MAX_MESSAGE = 16 * 1024 * 1024
+
+
+def _send(conn: socket.socket, message: Dict[str, Any]) -> None:
+    """Write one newline-terminated JSON message."""
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _receive(conn: socket.socket) -> Dict[str, Any]:
+    """Read one newline-terminated JSON message."""
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if chunk.endswith(b"\n") or size > _MAX_MESSAGE:
+            break
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+def call(message: Dict[str, Any], timeout: float = 300) -> Dict[str, Any]:
+    """
+    Send one request to the daemon.
+    
+    Raises:
+        OSError: If no daemon is listening
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(timeout)
+        conn.connect(str(SOCKET_FILE))
+        _send(conn, message)
+        return _receive(conn)
+    finally:
+        conn.close()
+
+
+def is_running() -> bool:
+    """Check whether a daemon answers on SOCKET_FILE."""
+    if not hasattr(socket, "AF_UNIX") or not SOCKET_FILE.exists():
+        return False
+    try:
+        return call({"control": "ping"}, timeout=2).get("ok", False)
+    except (OSError, ValueError):
+        return False
+
+
+def run_command(argv: List[str]) -> int:
+    """
+    Run a gcal_core command through the daemon, or in-process if none is running.
+    
+    Returns:
+        Process exit code of the command
+    """
+    if hasattr(socket, "AF_UNIX") and SOCKET_FILE.exists():
+        try:
+            response = call({"argv": argv, "cwd": os.getcwd()})
+        except (OSError, ValueError):
+            response = None  # Stale socket: fall through
+        if response is not None:
+            sys.stdout.write(response.get("stdout", ""))
+            sys.stderr.write(response.get("stderr", ""))
+            return response.get("code", 1)
+    
+    from gcal_core import main
+    try:
+        main(argv)
+    except SystemExit as e:
+        return _exit_code(e)
+    return 0
+
+
+def _exit_code(exit: SystemExit) -> int:
+    """Map a SystemExit raised by argparse/sys.exit to a process exit code."""
+    if exit.code is None:
+        return 0
+    return exit.code if isinstance(exit.code, int) else 1
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+class Daemon:
+    """
+    Serves gcal_core commands from one warm process.
+    
+    Requests are handled one at a time on the serving thread, so stdout
+    can be captured per request; the Calendar service and its keep-alive
+    connections stay warm between requests. The background sync takes the
+    same lock.
+    """
+    
+    def __init__(self, sync_interval: int = SYNC_INTERVAL_SECONDS):
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sock = None
+        self.started_at = time.time()
+        self.requests = 0
+    
+    def serve(self) -> None:
+        """Listen on SOCKET_FILE until stopped."""
+        import gcal_auth
+        import gcal_core  # Warm imports, timezone and service up front
+        gcal_auth.enable_refresh_ahead()
+        gcal_core.get_timezone()
+        gcal_core.get_calendar_service()
+        
+        SOCKET_FILE.parent.mkdir(parents=True, exist_ok=True)
+        if SOCKET_FILE.exists():
+            if is_running():
+                raise RuntimeError(f"A daemon is already listening on {SOCKET_FILE}")
+            SOCKET_FILE.unlink()
+        
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)  # Socket readable/writable by owner only
+        try:
+            self._sock.bind(str(SOCKET_FILE))
+        finally:
+            os.umask(old_umask)
+        self._sock.listen(16)
+        self._sock.settimeout(1.0)
+        
+        if self.sync_interval > 0:
+            threading.Thread(target=self._sync_loop, daemon=True).start()
+        
+        print(f"[OK] gcal-pro daemon listening on {SOCKET_FILE}")
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    conn.settimeout(None)
+                    self._handle(conn)
+        finally:
+            self._sock.close()
+            try:
+                SOCKET_FILE.unlink()
+            except OSError:
+                pass
+    
+    def _handle(self, conn: socket.socket) -> None:
+        """Answer one connection: a control message or a command."""
+        try:
+            request = _receive(conn)
+        except (OSError, ValueError) as e:
+            _send(conn, {"ok": False, "code": 2, "stderr": f"Bad request: {e}\n"})
+            return
+        
+        control = request.get("control")
+        if control == "ping":
+            response = {"ok": True, "pid": os.getpid(), "uptime": time.time() - self.started_at,
+                        "requests": self.requests}
+        elif control == "stop":
+            self._stop.set()
+            response = {"ok": True}
+        else:
+            response = self.execute(request.get("argv") or [], request.get("cwd"))
+        
+        try:
+            _send(conn, response)
+        except OSError:
+            pass  # Client went away
+    
+    def execute(self, argv: List[str], cwd: str = None) -> Dict[str, Any]:
+        """Run gcal_core.main(argv) with output captured."""
+        from gcal_core import main
+        
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = 0
+        with self._lock:
+            self.requests += 1
+            previous_cwd = os.getcwd()
+            try:
+                if cwd:
+                    os.chdir(cwd)  # Relative paths (bulk --file) are the client's
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    main(argv)
+            except SystemExit as e:
+                code = _exit_code(e)
+            except Exception as e:
+                stderr.write(f"Error: {e}\n")
+                code = 1
+            finally:
+                os.chdir(previous_cwd)
+        return {"ok": code == 0, "code": code,
+                "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+    
+    def _sync_loop(self) -> None:
+        """Keep every stored calendar (and the precomputed brief) current."""
+        import gcal_core
+        import gcal_sync
+        
+        while not self._stop.wait(self.sync_interval):
+            with self._lock:
+                with redirect_stdout(io.StringIO()):
+                    for calendar_id in gcal_sync.synced_calendars():
+                        gcal_sync.sync_calendar(calendar_id)
+                    gcal_core.refresh_precomputed_brief()
+
+
+# CLI interface
+if __name__ == "__main__":
+    argv = sys.argv[1:]
+    command = argv[0] if argv else None
+    
+    if command in (None, "-h", "--help"):
+        print(__doc__.strip())
+        sys.exit(0)
+    
+    if command in ("serve", "stop", "status") and not hasattr(socket, "AF_UNIX"):
+        print("Error: Unix domain sockets are not available on this platform")
+        sys.exit(1)
+    
+    if command == "serve":
+        try:
+            Daemon().serve()
+        except (RuntimeError, OSError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            pass
+    
+    elif command == "stop":
+        if not is_running():
+            print("Daemon is not running.")
+            sys.exit(1)
+        call({"control": "stop"})
+        print("[OK] Daemon stopped.")
+    
+    elif command == "status":
+        if not is_running():
+            print("Daemon:   not running")
+            sys.exit(1)
+        info = call({"control": "ping"})
+        print(f"Daemon:   running (pid {info['pid']})")
+        print(f"Socket:   {SOCKET_FILE}")
+        print(f"Uptime:   {info['uptime']:.0f}s")
+        print(f"Requests: {info['requests']}")
+    
+    else:
+        sys.exit(run_command(argv))
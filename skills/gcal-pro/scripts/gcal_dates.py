@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: Natural-Language Date Parsing
+Resolves phrases like "next Friday 3pm", "in 2 hours" or "eod" with a
+compiled rule table, falling back to dateutil's fuzzy parser.
+"""
+
+import re
+from datetime import date, datetime, time, timedelta, tzinfo
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+# Time of day used when a phrase names a day but no time ("tomorrow")
+DEFAULT_HOUR = 9
+# What "eod" / "end of week" mean
+END_OF_DAY = time(17, 0)
+END_OF_WEEK_DAY = 4  # Friday
+
+# Distinct (text, reference day, timezone) resolutions kept in memory
+PARSE_CACHE_SIZE = 1024
+
+_WEEKDAYS = {
+    "mon": 0, "monday": 0,
+    "tue": 1, "tues": 1, "tuesday": 1,
+    "wed": 2, "weds": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3,
+    "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5,
+    "sun": 6, "sunday": 6,
+}
+
+_UNITS = {
+    "m": "minutes", "min": "minutes", "mins": "minutes", "minute": "minutes", "minutes": "minutes",
+    "h": "hours", "hr": "hours", "hrs": "hours", "hour": "hours", "hours": "hours",
+    "d": "days", "day": "days", "days": "days",
+    "w": "weeks", "wk": "weeks", "wks": "weeks", "week": "weeks", "weeks": "weeks",
+}
+
+_WEEKDAY = "|".join(sorted(_WEEKDAYS, key=len, reverse=True))
+_UNIT = "|".join(sorted(_UNITS, key=len, reverse=True))
+_DAY = rf"(?:today|tonight|tomorrow|tmrw|(?:(?P<mod>this|next)\s+)?(?P<weekday>{_WEEKDAY}))"
+_TIME = r"(?:noon|midnight|\d{1,2}(?::\d{2})?\s*[ap]\.?m\.?|\d{1,2}:\d{2})"
+_TIME_PARTS = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*(?:([ap])\.?m\.?)?")
+
+# A resolution is either ("at", datetime) or ("in", timedelta from the reference)
+Resolution = Tuple[str, object]
+
+
+def _parse_clock(text: str) -> Optional[time]:
+    """Parse "3pm", "3:30 pm", "15:30", "noon" or "midnight"."""
+    if text == "noon":
+        return time(12, 0)
+    if text == "midnight":
+        return time(0, 0)
+    match = _TIME_PARTS.fullmatch(text)
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    meridiem = match.group(3)
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem == "p" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def _resolve_day(day_text: str, mod: Optional[str], weekday: Optional[str], today: date) -> date:
+    """Resolve a day word relative to `today`."""
+    if day_text in ("today", "tonight"):
+        return today
+    if day_text in ("tomorrow", "tmrw"):
+        return today + timedelta(days=1)
+    # Bare/"this" weekday: next occurrence, today included; "next": strictly after today
+    ahead = (_WEEKDAYS[weekday] - today.weekday()) % 7
+    if mod == "next" and ahead == 0:
+        ahead = 7
+    return today + timedelta(days=ahead)
+
+
+def _day_and_time(match: re.Match, today: date, tz: tzinfo) -> Resolution:
+    """Rule: a day word and/or a clock time ("fri 3pm", "3pm tomorrow")."""
+    day = match.group("day")
+    clock = match.group("time")
+    when = _resolve_day(day, match.group("mod"), match.group("weekday"), today) if day else today
+    if clock:
+        at = _parse_clock(clock)
+        if at is None:
+            raise ValueError(clock)
+    elif day == "tonight":
+        at = time(20, 0)
+    else:
+        at = time(DEFAULT_HOUR, 0)
+    return "at", datetime.combine(when, at, tz)
+
+
+def _relative(match: re.Match, today: date, tz: tzinfo) -> Resolution:
+    """Rule: "in 2 hours", "in 30 min"."""
+    return "in", timedelta(**{_UNITS[match.group("unit")]: int(match.group("count"))})
+
+
+def _now(match: re.Match, today: date, tz: tzinfo) -> Resolution:
+    """Rule: "now"."""
+    return "in", timedelta(0)
+
+
+def _end_of_day(match: re.Match, today: date, tz: tzinfo) -> Resolution:
+    """Rule: "eod" / "end of day"."""
+    return "at", datetime.combine(today, END_OF_DAY, tz)
+
+
+def _end_of_week(match: re.Match, today: date, tz: tzinfo) -> Resolution:
+    """Rule: "eow" / "end of week" (this Friday at END_OF_DAY)."""
+    ahead = (END_OF_WEEK_DAY - today.weekday()) % 7
+    return "at", datetime.combine(today + timedelta(days=ahead), END_OF_DAY, tz)
+
+
+def _next_week(match: re.Match, today: date, tz: tzinfo) -> Resolution:
+    """Rule: "next week" (a week from today at DEFAULT_HOUR)."""
+    return "at", datetime.combine(today + timedelta(weeks=1), time(DEFAULT_HOUR, 0), tz)
+
+
+# Rules are tried in order against the normalized (lowercased, single-spaced) text
+_RULES: List[Tuple[re.Pattern, Callable[[re.Match, date, tzinfo], Resolution]]] = [
+    (re.compile(r"now|right now"), _now),
+    (re.compile(r"eod|end of (?:the )?day|by end of day"), _end_of_day),
+    (re.compile(r"eow|end of (?:the )?week"), _end_of_week),
+    (re.compile(r"next week"), _next_week),
+    (re.compile(rf"in (?P<count>\d+) ?(?P<unit>{_UNIT})"), _relative),
+    (re.compile(rf"(?P<day>{_DAY})(?:,? (?:at |@ ?)?(?P<time>{_TIME}))?"), _day_and_time),
+    (re.compile(rf"(?:at |@ ?)?(?P<time>{_TIME})(?: (?:on )?(?P<day>{_DAY}))?"), _day_and_time),
+]
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so equivalent phrases share a cache entry."""
+    return " ".join(text.lower().split())
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _resolve(text: str, today: date, tz: tzinfo) -> Resolution:
+    """Resolve normalized text against a reference day (memoized)."""
+    for pattern, handler in _RULES:
+        match = pattern.fullmatch(text)
+        if match:
+            try:
+                return handler(match, today, tz)
+            except ValueError:
+                break  # e.g. "13pm": let dateutil decide
+    
+    # Slow path: dateutil's fuzzy parser, defaulting missing fields to 9:00 today
+    from dateutil import parser as date_parser
+    
+    default = datetime.combine(today, time(DEFAULT_HOUR, 0))
+    parsed = date_parser.parse(text, fuzzy=True, default=default)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz)
+    return "at", parsed
+
+
+def parse_datetime(text: str, reference: datetime) -> datetime:
+    """
+    Parse a natural-language date/time relative to `reference`.
+    
+    Results are memoized per (text, reference day, timezone), so repeated
+    phrases skip both the rule table and the fuzzy parser.
+    
+    Args:
+        text: Natural language date/time (e.g., "next Friday 3pm", "in 2 hours")
+        reference: Timezone-aware reference datetime
+        
+    Returns:
+        Parsed datetime with timezone
+    """
+    try:
+        kind, value = _resolve(_normalize(text), reference.date(), reference.tzinfo)
+    except (ValueError, OverflowError):
+        raise ValueError(f"Could not parse datetime: {text}")
+    return reference + value if kind == "in" else value
+
+
+def cache_info():
+    """Hit/miss statistics of the parse cache."""
+    return _resolve.cache_info()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: Free/Busy Engine
+Merges busy time from one or more calendars into a sorted interval index
+and answers free-slot queries against it.
+"""
+
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Sequence
+
+from gcal_auth import get_calendar_service
+import gcal_api
+from gcal_api import CalendarAPIError
+
+# freebusy().query accepts at most 50 calendars per request
+FREEBUSY_MAX_ITEMS = 50
+
+# Monday..Friday, as returned by datetime.weekday()
+WORKDAYS = (0, 1, 2, 3, 4)
+
+Interval = Tuple[datetime, datetime]
+
+
+class BusyIndex:
+    """
+    Disjoint, sorted busy intervals with O(log n) lookups.
+    
+    Overlapping and adjacent intervals are merged on construction, so a
+    range query is a bisect on the start times followed by a walk over
+    the intervals that actually intersect the range.
+    """
+    
+    __slots__ = ("_starts", "_ends")
+    
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        starts: List[float] = []
+        ends: List[float] = []
+        for start, end in sorted((s.timestamp(), e.timestamp()) for s, e in intervals):
+            if end <= start:
+                continue
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts = starts
+        self._ends = ends
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]], include_all_day: bool = False) -> "BusyIndex":
+        """
+        Build an index from parsed event dicts.
+        
+        Args:
+            events: Events from gcal_core (need start_dt/end_dt)
+            include_all_day: Treat all-day events as busy
+        """
+        return cls(
+            (e["start_dt"], e["end_dt"]) for e in events
+            if e.get("start_dt") and e.get("end_dt")
+            and (include_all_day or not e.get("all_day"))
+            and e.get("status") != "cancelled"
+        )
+    
+    @classmethod
+    def from_freebusy(cls, calendars: Dict[str, Any]) -> "BusyIndex":
+        """Build an index from the `calendars` map of a freebusy().query response."""
+        from dateutil import parser as date_parser
+        
+        return cls(
+            (date_parser.isoparse(b["start"]), date_parser.isoparse(b["end"]))
+            for cal in calendars.values()
+            for b in cal.get("busy", [])
+        )
+    
+    def busy_between(self, start: datetime, end: datetime) -> List[Tuple[float, float]]:
+        """Return busy (start_ts, end_ts) pairs intersecting [start, end)."""
+        lo, hi = start.timestamp(), end.timestamp()
+        # The interval containing `lo` (if any) starts at or before it
+        i = max(bisect_right(self._starts, lo) - 1, 0)
+        result = []
+        while i < len(self._starts) and self._starts[i] < hi:
+            if self._ends[i] > lo:
+                result.append((self._starts[i], self._ends[i]))
+            i += 1
+        return result
+    
+    def is_free(self, start: datetime, end: datetime, buffer_minutes: int = 0) -> bool:
+        """Check whether [start, end) is free, keeping `buffer_minutes` around it."""
+        buffer = timedelta(minutes=buffer_minutes)
+        return not self.busy_between(start - buffer, end + buffer)
+    
+    def free_slots(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        duration_minutes: int = 60,
+        buffer_minutes: int = 0,
+        working_hours: Tuple[time, time] = None,
+        working_days: Sequence[int] = WORKDAYS,
+        limit: int = None
+    ) -> List[Interval]:
+        """
+        Find free gaps of at least `duration_minutes` in [time_min, time_max).
+        
+        Args:
+            time_min: Start of search range (timezone-aware)
+            time_max: End of search range (timezone-aware)
+            duration_minutes: Minimum slot duration
+            buffer_minutes: Gap to keep after and before busy intervals,
+                including ones just outside a window (a meeting ending at
+                8:55 pushes a 9:00 window start to 9:10 with 15 minutes)
+            working_hours: (start, end) local times to search within (default: all day)
+            working_days: Weekdays searched when working_hours is set (0 = Monday)
+            limit: Stop after this many slots
+            
+        Returns:
+            List of (start, end) tuples in time_min's timezone
+        """
+        tz = time_min.tzinfo
+        needed = duration_minutes * 60
+        buffer = buffer_minutes * 60
+        reach = timedelta(minutes=buffer_minutes)
+        slots: List[Interval] = []
+        
+        for window_start, window_end in _windows(time_min, time_max, working_hours, working_days):
+            cursor = window_start.timestamp()
+            window_stop = window_end.timestamp()
+            # Busy time up to a buffer outside the window still narrows it
+            for busy_start, busy_end in self.busy_between(window_start - reach, window_end + reach):
+                slot_end = min(busy_start - buffer, window_stop)
+                if slot_end - cursor >= needed:
+                    slots.append((cursor, slot_end))
+                cursor = max(cursor, busy_end + buffer)
+            if window_stop - cursor >= needed:
+                slots.append((cursor, window_stop))
+            if limit and len(slots) >= limit:
+                break
+        
+        slots = slots[:limit] if limit else slots
+        return [(datetime.fromtimestamp(s, tz), datetime.fromtimestamp(e, tz)) for s, e in slots]
+
+
+def _windows(
+    time_min: datetime,
+    time_max: datetime,
+    working_hours: Optional[Tuple[time, time]],
+    working_days: Sequence[int]
+) -> Iterable[Interval]:
+    """Yield the searchable windows of [time_min, time_max) under a working-hours mask."""
+    if working_hours is None:
+        yield time_min, time_max
+        return
+    
+    day_start, day_end = working_hours
+    day = time_min.date()
+    while day <= time_max.date():
+        if day.weekday() in working_days:
+            start = max(datetime.combine(day, day_start, time_min.tzinfo), time_min)
+            end = min(datetime.combine(day, day_end, time_min.tzinfo), time_max)
+            if start < end:
+                yield start, end
+        day += timedelta(days=1)
+
+
+def query_freebusy(
+    calendar_ids: List[str],
+    time_min: datetime,
+    time_max: datetime,
+    service=None
+) -> BusyIndex:
+    """
+    Fetch busy time for calendars with freebusy().query.
+    
+    The endpoint honours event transparency and declined invitations, and
+    returns only busy ranges, so it is much lighter than listing events.
+    
+    Args:
+        calendar_ids: Calendar IDs or attendee emails
+        time_min: Start of range
+        time_max: End of range
+        service: Calendar API service (default: shared session service)
+        
+    Returns:
+        BusyIndex over all calendars
+        
+    Raises:
+        CalendarAPIError: If not authenticated or the API cannot be reached,
+            or (reason "freeBusyUnavailable") if the busy time of any
+            calendar could not be read, e.g. an attendee who does not share
+            free/busy; such calendars are never treated as free
+    """
+    if service is None:
+        service = get_calendar_service()
+    if not service:
+        raise CalendarAPIError("Not authenticated (run gcal_auth.py auth)",
+                               reason="unauthenticated")
+    
+    calendars: Dict[str, Any] = {}
+    for i in range(0, len(calendar_ids), FREEBUSY_MAX_ITEMS):
+        chunk = calendar_ids[i:i + FREEBUSY_MAX_ITEMS]
+        result = gcal_api.execute(service.freebusy().query(body={
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "items": [{"id": cal_id} for cal_id in chunk]
+        }))
+        calendars.update(result.get("calendars", {}))
+    
+    # Answers are keyed by calendar ID, which Google may return in another case
+    answered = {cal_id.lower(): cal for cal_id, cal in calendars.items()}
+    unavailable = []
+    for cal_id in calendar_ids:
+        errors = answered.get(cal_id.lower(), {"errors": [{"reason": "missing"}]}).get("errors")
+        if errors:
+            reasons = ", ".join(sorted({e.get("reason") or "unknown" for e in errors}))
+            unavailable.append(f"{cal_id} ({reasons})")
+    if unavailable:
+        raise CalendarAPIError(
+            f"No free/busy information for {'; '.join(unavailable)}. "
+            f"Their calendar must exist and share free/busy with you.",
+            reason="freeBusyUnavailable"
+        )
+    return BusyIndex.from_freebusy(calendars)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: Pooled HTTP Transport
+An httplib2-compatible transport for googleapiclient backed by a requests
+session, so every Calendar call in the process shares one pool of
+keep-alive connections (one TLS handshake per connection, not per call).
+"""
+
+import os
+from typing import Optional, Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httplib2
+    from google.auth.credentials import Credentials
+
+# Keep-alive connections kept per host; at least gcal_core's MAX_FETCH_WORKERS
+POOL_SIZE = int(os.environ.get("GCAL_PRO_POOL_SIZE", "10"))
+# Connect/read timeout per request (httplib2's default is to wait forever)
+REQUEST_TIMEOUT_SECONDS = 60
+
+
+class PooledHttp:
+    """
+    Drop-in for the httplib2.Http that googleapiclient builds per service.
+    
+    Requests go through a google-auth AuthorizedSession (which adds the
+    access token and refreshes it when expired or on 401; see
+    gcal_auth._route_refresh) mounted with a urllib3 pool of
+    `pool_size` connections. urllib3 pools are thread-safe, so one instance
+    and the service built on it can be shared by every thread.
+    
+    Retries are left to gcal_api.execute; the adapter never retries itself.
+    """
+    
+    def __init__(
+        self,
+        credentials: "Credentials",
+        pool_size: int = POOL_SIZE,
+        timeout: float = REQUEST_TIMEOUT_SECONDS
+    ):
+        from google.auth.transport.requests import AuthorizedSession
+        from requests.adapters import HTTPAdapter
+        
+        self.timeout = timeout
+        self.session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    @property
+    def credentials(self) -> "Credentials":
+        """Credentials used for requests (googleapiclient applies them to batch parts)."""
+        return self.session.credentials
+    
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body=None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = 5,
+        connection_type=None
+    ) -> Tuple["httplib2.Response", bytes]:
+        """
+        Send a request with httplib2.Http.request's signature and return type.
+        
+        Raises:
+            requests.RequestException: On network failure (an OSError, so
+                gcal_api treats it as transient)
+        """
+        import httplib2
+        
+        response = self.session.request(
+            method, uri, data=body, headers=headers,
+            timeout=self.timeout, allow_redirects=redirections > 0
+        )
+        resp = httplib2.Response(dict(response.headers, status=str(response.status_code)))
+        resp.reason = response.reason
+        # requests has already decoded the body, as httplib2 would have
+        if "content-encoding" in resp:
+            resp["-content-encoding"] = resp.pop("content-encoding")
+        return resp, response.content
+    
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
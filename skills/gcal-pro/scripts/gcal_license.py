@@ -7,13 +7,19 @@ Handles Pro tier license validation.
 import json
 import hashlib
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 CONFIG_DIR = Path.home() / ".config" / "gcal-pro"
 LICENSE_FILE = CONFIG_DIR / "license.json"
 
+# Parsed license.json, kept per process and keyed by the file's stat
+# signature, so checks only re-read it after it changes on disk
+_license_lock = threading.Lock()
+_license_cache: Optional[Tuple[Optional[Tuple[int, int, int]], Dict[str, Any]]] = None
+
 # Simple license key format: GCAL-XXXX-XXXX-XXXX
 # In production, you'd use a more robust system (Gumroad API, etc.)
 
@@ -82,6 +88,7 @@ def activate_license(key: str) -> Dict[str, Any]:
     try:
         with open(LICENSE_FILE, "w") as f:
             json.dump(license_data, f, indent=2)
+        invalidate_cache()
         
         # Secure the file
         try:
@@ -101,8 +108,39 @@ def activate_license(key: str) -> Dict[str, Any]:
         }
 
 
+def _license_signature() -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of the license file, or None if it is missing."""
+    try:
+        st = os.stat(LICENSE_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def invalidate_cache() -> None:
+    """Forget the cached license state (called after writing the file)."""
+    global _license_cache
+    with _license_lock:
+        _license_cache = None
+
+
 def get_license_info() -> Dict[str, Any]:
-    """Get current license information."""
+    """
+    Get current license information.
+    
+    The file is parsed once per process and re-read only when its mtime,
+    size or inode changes, so repeated checks cost a single stat().
+    """
+    global _license_cache
+    signature = _license_signature()
+    with _license_lock:
+        if _license_cache is None or _license_cache[0] != signature:
+            _license_cache = (signature, _read_license_file())
+        return dict(_license_cache[1])
+
+
+def _read_license_file() -> Dict[str, Any]:
+    """Parse license.json into the get_license_info() format."""
     if not LICENSE_FILE.exists():
         return {
             "tier": "free",
@@ -133,6 +171,7 @@ def deactivate_license() -> Dict[str, Any]:
     if LICENSE_FILE.exists():
         try:
             LICENSE_FILE.unlink()
+            invalidate_cache()
             return {
                 "success": True,
                 "message": "License deactivated. Reverted to free tier."
@@ -0,0 +1,656 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: Incremental Sync Module
+Keeps a local event store in step with Google Calendar using sync tokens.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple
+
+from gcal_auth import CONFIG_DIR, get_config_dir, get_calendar_service
+import gcal_api
+from gcal_api import CalendarAPIError
+
+STORE_FILE = CONFIG_DIR / "events.db"
+
+# Window fetched by a full sync; deltas after that come from nextSyncToken
+SYNC_LOOKBACK_DAYS = 30
+SYNC_LOOKAHEAD_DAYS = 365
+
+# API maximum page size for events().list
+SYNC_PAGE_SIZE = 2500
+
+# Bump when the schema of the event tables changes; they are a cache and are
+# rebuilt. The channels table is never dropped (see _migrate_channels)
+SCHEMA_VERSION = 5
+
+# One connection per process, shared by all threads under _conn_lock; the
+# schema is checked when it is opened, not on every call
+_conn: Optional[sqlite3.Connection] = None
+_conn_key: Optional[Tuple[str, int]] = None
+_conn_lock = threading.RLock()
+
+# Bumped whenever this process changes stored events, so caches derived
+# from the store (gcal_core's busy-interval indexes) can tell they are stale
+_generation = 0
+
+# A calendar watched by a live push channel (see gcal_watch) is synced on
+# every change notification, so its store is trusted this long between syncs
+WATCHED_TTL_SECONDS = 6 * 3600
+# ...as long as the notification receiver has checked in this recently
+RECEIVER_HEARTBEAT_SECONDS = 180
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    event_id    TEXT NOT NULL,
+    start_ts    REAL NOT NULL,
+    end_ts      REAL NOT NULL,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, event_id)
+);
+CREATE INDEX IF NOT EXISTS events_start ON events (calendar_id, start_ts);
+CREATE INDEX IF NOT EXISTS events_end ON events (calendar_id, end_ts);
+CREATE TABLE IF NOT EXISTS sync_state (
+    calendar_id  TEXT PRIMARY KEY,
+    sync_token   TEXT,
+    window_start TEXT NOT NULL,
+    window_end   TEXT NOT NULL,
+    synced_at    REAL NOT NULL,
+    -- Longest stored event (seconds); bounds query_events() from below
+    max_duration REAL NOT NULL DEFAULT 0
+);
+"""
+
+# Push channels are live registrations at Google (their tokens and resource
+# IDs are needed to verify notifications and to stop them), so this table
+# survives SCHEMA_VERSION resets and is migrated in place
+_CHANNELS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    channel_id  TEXT PRIMARY KEY,
+    calendar_id TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    token       TEXT NOT NULL,
+    address     TEXT NOT NULL,
+    expiration  REAL NOT NULL,
+    heartbeat   REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS channels_calendar ON channels (calendar_id);
+"""
+
+# Columns added to channels since it was introduced: (name, definition)
+_CHANNEL_MIGRATIONS = (
+    ("heartbeat", "REAL NOT NULL DEFAULT 0"),
+)
+
+# Full-text index over the searchable fields of stored events, kept in
+# step with the events table by triggers (rowid is shared)
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    summary, description, location, attendees,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+    INSERT INTO events_fts (rowid, summary, description, location, attendees)
+    VALUES (new.rowid,
+            json_extract(new.data, '$.summary'),
+            json_extract(new.data, '$.description'),
+            json_extract(new.data, '$.location'),
+            (SELECT group_concat(value, ' ') FROM json_each(new.data, '$.attendees')));
+END;
+CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+    DELETE FROM events_fts WHERE rowid = old.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS events_fts_update AFTER UPDATE ON events BEGIN
+    DELETE FROM events_fts WHERE rowid = old.rowid;
+    INSERT INTO events_fts (rowid, summary, description, location, attendees)
+    VALUES (new.rowid,
+            json_extract(new.data, '$.summary'),
+            json_extract(new.data, '$.description'),
+            json_extract(new.data, '$.location'),
+            (SELECT group_concat(value, ' ') FROM json_each(new.data, '$.attendees')));
+END;
+"""
+
+# bm25 column weights: summary, description, location, attendees
+_FTS_WEIGHTS = (10.0, 1.0, 3.0, 2.0)
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the event store, creating the schema on first use."""
+    get_config_dir()
+    conn = sqlite3.connect(str(STORE_FILE), timeout=30, check_same_thread=False)
+    # WAL lets concurrent calendar syncs read while another one writes
+    conn.execute("PRAGMA journal_mode = WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript(
+            "DROP TABLE IF EXISTS events; DROP TABLE IF EXISTS events_fts; "
+            "DROP TABLE IF EXISTS sync_state;"
+        )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(_SCHEMA)
+    _migrate_channels(conn)
+    try:
+        conn.executescript(_FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        pass  # SQLite built without FTS5: search_events() falls back to LIKE
+    return conn
+
+
+def _migrate_channels(conn: sqlite3.Connection) -> None:
+    """Create the channels table, or add the columns an older store lacks."""
+    conn.executescript(_CHANNELS_SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(channels)")}
+    for name, definition in _CHANNEL_MIGRATIONS:
+        if name not in columns:
+            conn.execute(f"ALTER TABLE channels ADD COLUMN {name} {definition}")
+    conn.commit()
+
+
+@contextmanager
+def _store():
+    """Yield the process's store connection, locked, committing on success."""
+    global _conn, _conn_key
+    with _conn_lock:
+        # Reopen after a fork, or if STORE_FILE was pointed elsewhere
+        key = (str(STORE_FILE), os.getpid())
+        if _conn_key != key:
+            if _conn is not None and _conn_key[1] == key[1]:
+                _conn.close()
+            _conn = _connect()
+            _conn_key = key
+        with _conn:
+            yield _conn
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def generation() -> int:
+    """Counter that changes whenever this process changes stored events."""
+    return _generation
+
+
+def _changed() -> None:
+    """Record a change to stored events (see generation())."""
+    global _generation
+    _generation += 1
+
+
+def get_sync_state(calendar_id: str = "primary") -> Optional[Dict[str, Any]]:
+    """Return the stored sync state for a calendar, or None if never synced."""
+    with _store() as conn:
+        row = conn.execute(
+            "SELECT sync_token, window_start, window_end, synced_at "
+            "FROM sync_state WHERE calendar_id = ?",
+            (calendar_id,)
+        ).fetchone()
+    if not row:
+        return None
+    return {
+        "sync_token": row[0],
+        "window_start": datetime.fromisoformat(row[1]),
+        "window_end": datetime.fromisoformat(row[2]),
+        "synced_at": row[3]
+    }
+
+
+def is_fresh(calendar_id: str, ttl: float) -> bool:
+    """
+    Check whether a calendar was synced within the last `ttl` seconds.
+    
+    While a push channel watches the calendar the limit is raised to
+    WATCHED_TTL_SECONDS, since each change notification triggers a sync.
+    """
+    state = get_sync_state(calendar_id)
+    if not state:
+        return False
+    if is_watched(calendar_id):
+        ttl = max(ttl, WATCHED_TTL_SECONDS)
+    return time.time() - state["synced_at"] < ttl
+
+
+def mark_stale(calendar_id: str) -> None:
+    """Force the next read of a calendar to sync (e.g. after a local write)."""
+    with _store() as conn:
+        conn.execute("UPDATE sync_state SET synced_at = 0 WHERE calendar_id = ?", (calendar_id,))
+
+
+def save_channel(channel: Dict[str, Any]) -> None:
+    """Store a push channel (keys as returned by list_channels())."""
+    with _store() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO channels "
+            "(channel_id, calendar_id, resource_id, token, address, expiration, heartbeat) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (channel["channel_id"], channel["calendar_id"], channel["resource_id"],
+             channel["token"], channel["address"], channel["expiration"],
+             channel.get("heartbeat", 0))
+        )
+
+
+_CHANNEL_COLUMNS = ("channel_id", "calendar_id", "resource_id", "token", "address",
+                    "expiration", "heartbeat")
+
+
+def _select_channels(where: str = "", params: Tuple = ()) -> List[Dict[str, Any]]:
+    """Query the channels table into dicts keyed by _CHANNEL_COLUMNS."""
+    with _store() as conn:
+        rows = conn.execute(
+            f"SELECT {', '.join(_CHANNEL_COLUMNS)} FROM channels {where} ORDER BY expiration",
+            params
+        ).fetchall()
+    return [dict(zip(_CHANNEL_COLUMNS, row)) for row in rows]
+
+
+def list_channels(calendar_id: str = None) -> List[Dict[str, Any]]:
+    """Return stored push channels (soonest to expire first), optionally for one calendar."""
+    if calendar_id:
+        return _select_channels("WHERE calendar_id = ?", (calendar_id,))
+    return _select_channels()
+
+
+def get_channel(channel_id: str) -> Optional[Dict[str, Any]]:
+    """Return one stored push channel, or None."""
+    channels = _select_channels("WHERE channel_id = ?", (channel_id,))
+    return channels[0] if channels else None
+
+
+def delete_channel(channel_id: str) -> None:
+    """Forget a push channel."""
+    with _store() as conn:
+        conn.execute("DELETE FROM channels WHERE channel_id = ?", (channel_id,))
+
+
+def touch_channels() -> None:
+    """Record that the notification receiver is running (see is_watched)."""
+    with _store() as conn:
+        conn.execute("UPDATE channels SET heartbeat = ?", (time.time(),))
+
+
+def is_watched(calendar_id: str) -> bool:
+    """Check for an unexpired channel on a calendar with a live receiver."""
+    now = time.time()
+    with _store() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM channels WHERE calendar_id = ? AND expiration > ? AND heartbeat > ?",
+            (calendar_id, now, now - RECEIVER_HEARTBEAT_SECONDS)
+        ).fetchone()
+    return row is not None
+
+
+def covers(calendar_id: str, time_min: Optional[datetime], time_max: Optional[datetime]) -> bool:
+    """
+    Check whether the synced window of a calendar contains [time_min, time_max].
+    
+    A missing bound stands for the edge of the window itself.
+    """
+    state = get_sync_state(calendar_id)
+    if not state:
+        return False
+    return (time_min is None or state["window_start"] <= time_min) and \
+        (time_max is None or time_max <= state["window_end"])
+
+
+def query_events(
+    calendar_id: str,
+    time_min: datetime,
+    time_max: datetime,
+    limit: int = None
+) -> List[Dict[str, Any]]:
+    """
+    Return stored events overlapping [time_min, time_max), ordered by start.
+    
+    An overlapping event cannot start before time_min minus the longest
+    event stored for the calendar, so the (calendar_id, start_ts) index is
+    searched over that bounded slice only. The cost grows with the events
+    starting in [time_min - longest, time_max), not with the store; one
+    very long event (a multi-month all-day entry) widens the slice for all
+    queries of its calendar.
+    
+    Args:
+        calendar_id: Calendar ID
+        time_min: Start of range (timezone-aware)
+        time_max: End of range (timezone-aware)
+        limit: Maximum events to return (default: all)
+        
+    Returns:
+        Normalized event dicts as stored (without start_dt/end_dt)
+    """
+    with _store() as conn:
+        state = conn.execute(
+            "SELECT max_duration FROM sync_state WHERE calendar_id = ?", (calendar_id,)
+        ).fetchone()
+        earliest = time_min.timestamp() - state[0] if state else float("-inf")
+        rows = conn.execute(
+            "SELECT data FROM events "
+            "WHERE calendar_id = ? AND start_ts >= ? AND start_ts < ? AND end_ts > ? "
+            "ORDER BY start_ts LIMIT ?",
+            (calendar_id, earliest, time_max.timestamp(), time_min.timestamp(),
+             limit if limit else -1)
+        ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match as a prefix."""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search(
+    query: str,
+    calendar_ids: List[str] = None,
+    time_min: datetime = None,
+    time_max: datetime = None,
+    limit: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Full-text search over stored events, best matches first.
+    
+    Matches summary, description, location and attendee emails, ranked
+    with bm25 (summary weighted highest).
+    
+    Args:
+        query: Free-text query; every word must match (prefixes allowed)
+        calendar_ids: Calendars to search (default: all synced calendars)
+        time_min: Only events ending after this time (optional)
+        time_max: Only events starting before this time (optional)
+        limit: Maximum events to return (None: all matches)
+        
+    Returns:
+        Normalized event dicts as stored (without start_dt/end_dt)
+    """
+    match = _fts_query(query)
+    limit = limit if limit else -1
+    if not match:
+        return []
+    
+    filters = []
+    params: List[Any] = []
+    if calendar_ids:
+        filters.append(f"e.calendar_id IN ({', '.join('?' * len(calendar_ids))})")
+        params.extend(calendar_ids)
+    if time_min is not None:
+        filters.append("e.end_ts > ?")
+        params.append(time_min.timestamp())
+    if time_max is not None:
+        filters.append("e.start_ts < ?")
+        params.append(time_max.timestamp())
+    where = "".join(f" AND {f}" for f in filters)
+    
+    with _store() as conn:
+        try:
+            rows = conn.execute(
+                "SELECT e.data FROM events_fts JOIN events e ON e.rowid = events_fts.rowid "
+                f"WHERE events_fts MATCH ?{where} "
+                f"ORDER BY bm25(events_fts, {', '.join(map(str, _FTS_WEIGHTS))}), e.start_ts "
+                "LIMIT ?",
+                [match] + params + [limit]
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # No FTS5: substring match on the stored JSON, ordered by start
+            words = re.findall(r"\w+", query.lower())
+            like = "".join(" AND lower(e.data) LIKE ?" for _ in words)
+            rows = conn.execute(
+                f"SELECT e.data FROM events e WHERE 1 = 1{like}{where} "
+                "ORDER BY e.start_ts LIMIT ?",
+                [f"%{w}%" for w in words] + params + [limit]
+            ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def synced_calendars() -> List[str]:
+    """Return the IDs of all calendars present in the store."""
+    with _store() as conn:
+        rows = conn.execute("SELECT calendar_id FROM sync_state").fetchall()
+    return [row[0] for row in rows]
+
+
+def get_stored_event(calendar_id: str, event_id: str) -> Optional[Dict[str, Any]]:
+    """Return one stored event dict, or None if it is not in the store."""
+    with _store() as conn:
+        row = conn.execute(
+            "SELECT data FROM events WHERE calendar_id = ? AND event_id = ?",
+            (calendar_id, event_id)
+        ).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def count_events(calendar_id: str = "primary") -> int:
+    """Return the number of events stored for a calendar."""
+    with _store() as conn:
+        return conn.execute(
+            "SELECT COUNT(*) FROM events WHERE calendar_id = ?",
+            (calendar_id,)
+        ).fetchone()[0]
+
+
+def clear_calendar(calendar_id: str) -> None:
+    """Forget all stored events and the sync token for a calendar."""
+    with _store() as conn:
+        conn.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+        conn.execute("DELETE FROM sync_state WHERE calendar_id = ?", (calendar_id,))
+    _changed()
+
+
+def _fetch_pages(service, **params) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Page through events().list and return (items, nextSyncToken)."""
+    from gcal_core import EVENT_FIELDS  # gcal_core imports this module
+    
+    items = []
+    page_token = None
+    while True:
+        result = gcal_api.execute(service.events().list(
+            pageToken=page_token,
+            maxResults=SYNC_PAGE_SIZE,
+            singleEvents=True,
+            fields=f"nextPageToken,nextSyncToken,items({EVENT_FIELDS})",
+            **params
+        ))
+        items.extend(result.get("items", []))
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return items, result.get("nextSyncToken")
+
+
+def _rows(calendar_id: str, items: List[Dict[str, Any]]) -> Tuple[List[Tuple], float]:
+    """
+    Normalize changed events (with _parse_event) into store rows.
+    
+    Runs before the store lock is taken: parsing may look up the calendar's
+    timezone over the network.
+    
+    Returns:
+        (rows, longest) - (event_id, start_ts, end_ts, data) per event, with
+        data None for cancelled ones, and the longest duration in seconds
+    """
+    from gcal_core import _parse_event  # gcal_core imports this module
+    
+    rows = []
+    longest = 0.0
+    for event in items:
+        if event.get("status") == "cancelled":
+            rows.append((event.get("id"), None, None, None))
+            continue
+        
+        parsed = _parse_event(event, calendar_id)
+        start_dt = parsed.start_dt
+        end_dt = parsed.end_dt
+        if not start_dt or not end_dt:
+            continue
+        longest = max(longest, end_dt.timestamp() - start_dt.timestamp())
+        rows.append((parsed.id, start_dt.timestamp(), end_dt.timestamp(),
+                     json.dumps(parsed.to_dict(datetimes=False))))
+    return rows, longest
+
+
+def _apply(conn: sqlite3.Connection, calendar_id: str, rows: List[Tuple]) -> None:
+    """Upsert the rows built by _rows() and drop cancelled events."""
+    if rows:
+        _changed()
+    for event_id, start_ts, end_ts, data in rows:
+        if data is None:
+            conn.execute(
+                "DELETE FROM events WHERE calendar_id = ? AND event_id = ?",
+                (calendar_id, event_id)
+            )
+            continue
+        # Upsert (not REPLACE) so the row keeps its rowid and the FTS
+        # update trigger fires
+        conn.execute(
+            "INSERT INTO events (calendar_id, event_id, start_ts, end_ts, data) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (calendar_id, event_id) DO UPDATE SET "
+            "start_ts = excluded.start_ts, end_ts = excluded.end_ts, data = excluded.data",
+            (calendar_id, event_id, start_ts, end_ts, data)
+        )
+
+
+def full_sync(service, calendar_id: str = "primary") -> int:
+    """
+    Replace the stored events of a calendar with a fresh download.
+    
+    Args:
+        service: Calendar API service
+        calendar_id: Calendar ID
+        
+    Returns:
+        Number of events stored
+    """
+    now = _utc_now()
+    window_start = now - timedelta(days=SYNC_LOOKBACK_DAYS)
+    window_end = now + timedelta(days=SYNC_LOOKAHEAD_DAYS)
+    
+    items, sync_token = _fetch_pages(
+        service,
+        calendarId=calendar_id,
+        timeMin=window_start.isoformat(),
+        timeMax=window_end.isoformat()
+    )
+    rows, longest = _rows(calendar_id, items)
+    
+    with _store() as conn:
+        conn.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+        _changed()
+        _apply(conn, calendar_id, rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_state "
+            "(calendar_id, sync_token, window_start, window_end, synced_at, max_duration) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (calendar_id, sync_token, window_start.isoformat(),
+             window_end.isoformat(), time.time(), longest)
+        )
+    return len(items)
+
+
+def incremental_sync(service, calendar_id: str, sync_token: str) -> int:
+    """
+    Apply the changes made since `sync_token` to the local store.
+    
+    Raises:
+        CalendarAPIError: status 410 when the token has expired (caller must resync)
+        
+    Returns:
+        Number of changed events applied
+    """
+    items, next_token = _fetch_pages(service, calendarId=calendar_id, syncToken=sync_token)
+    rows, longest = _rows(calendar_id, items)
+    
+    with _store() as conn:
+        _apply(conn, calendar_id, rows)
+        # Never shrinks on deletes; a too-wide bound only costs a little speed
+        conn.execute(
+            "UPDATE sync_state SET sync_token = ?, synced_at = ?, "
+            "max_duration = MAX(max_duration, ?) WHERE calendar_id = ?",
+            (next_token, time.time(), longest, calendar_id)
+        )
+    return len(items)
+
+
+def sync_calendar(calendar_id: str = "primary", service=None) -> bool:
+    """
+    Bring the local store for a calendar up to date.
+    
+    Does a full sync the first time (or when the synced window has half
+    run out), otherwise fetches only the delta since the last sync token.
+    An expired token (410 Gone) triggers a full resync.
+    
+    Args:
+        calendar_id: Calendar ID
+        service: Calendar API service (default: shared session service)
+        
+    Returns:
+        True if the store is up to date
+    """
+    if service is None:
+        service = get_calendar_service()
+    if not service:
+        return False
+    
+    state = get_sync_state(calendar_id)
+    rolling_limit = _utc_now() + timedelta(days=SYNC_LOOKAHEAD_DAYS / 2)
+    
+    try:
+        if state and state["sync_token"] and state["window_end"] > rolling_limit:
+            try:
+                incremental_sync(service, calendar_id, state["sync_token"])
+                return True
+            except CalendarAPIError as e:
+                if e.status != 410:
+                    raise
+                # Sync token expired: wipe and start over
+                clear_calendar(calendar_id)
+        full_sync(service, calendar_id)
+        return True
+    except Exception as e:
+        print(f"Error syncing calendar {calendar_id}: {e}", file=sys.stderr)
+        return False
+
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="gcal-pro local event store")
+    parser.add_argument("command", choices=["sync", "resync", "status", "clear"],
+                        help="Sync command")
+    parser.add_argument("--calendar", "-c", default="primary",
+                        help="Calendar ID (default: primary)")
+    
+    args = parser.parse_args()
+    
+    if args.command == "sync":
+        if not sync_calendar(args.calendar):
+            exit(1)
+        print(f"[OK] {args.calendar} synced ({count_events(args.calendar)} events stored)")
+    
+    elif args.command == "resync":
+        clear_calendar(args.calendar)
+        if not sync_calendar(args.calendar):
+            exit(1)
+        print(f"[OK] {args.calendar} resynced ({count_events(args.calendar)} events stored)")
+    
+    elif args.command == "status":
+        state = get_sync_state(args.calendar)
+        if not state:
+            print(f"{args.calendar}: never synced")
+        else:
+            synced = datetime.fromtimestamp(state["synced_at"]).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"Calendar:    {args.calendar}")
+            print(f"Events:      {count_events(args.calendar)}")
+            print(f"Window:      {state['window_start']:%Y-%m-%d} -> {state['window_end']:%Y-%m-%d}")
+            print(f"Last sync:   {synced}")
+    
+    elif args.command == "clear":
+        clear_calendar(args.calendar)
+        print(f"[OK] Local store cleared for {args.calendar}")
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+gcal-pro: Push Notifications
+Registers events().watch channels, receives Google's change notifications
+on a local webhook and syncs the affected calendar, and renews channels
+before they expire.
+
+Google only delivers to a public HTTPS address, so run the receiver behind
+a reverse proxy or tunnel and register that public URL with `start`.
+"""
+
+import queue
+import secrets
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, Callable
+
+from gcal_auth import enable_refresh_ahead, get_calendar_service
+import gcal_api
+from gcal_api import CalendarAPIError
+import gcal_sync
+
+# Lifetime requested for new channels (Google caps events channels at ~7 days)
+WATCH_TTL_SECONDS = 7 * 24 * 3600
+# Channels expiring within this margin are replaced by renew_channels()
+RENEW_BEFORE_SECONDS = 12 * 3600
+# How often the receiver checks for channels to renew and reports it is alive
+MAINTENANCE_INTERVAL_SECONDS = 60
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def start_channel(
+    calendar_id: str,
+    address: str,
+    ttl_seconds: int = WATCH_TTL_SECONDS,
+    service=None
+) -> Optional[Dict[str, Any]]:
+    """
+    Open a push channel for a calendar's events.
+    
+    Args:
+        calendar_id: Calendar to watch
+        address: Public HTTPS URL that forwards to the receiver
+        ttl_seconds: Requested channel lifetime
+        service: Calendar API service (default: shared session service)
+        
+    Returns:
+        Stored channel dict, or None on failure
+    """
+    if service is None:
+        service = get_calendar_service()
+    if not service:
+        return None
+    
+    token = secrets.token_urlsafe(24)
+    try:
+        result = gcal_api.execute(service.events().watch(calendarId=calendar_id, body={
+            "id": str(uuid.uuid4()),
+            "type": "web_hook",
+            "address": address,
+            "token": token,
+            "params": {"ttl": str(int(ttl_seconds))}
+        }))
+    except CalendarAPIError as e:
+        print(f"Error starting channel for {calendar_id}: {e}")
+        return None
+    
+    channel = {
+        "channel_id": result["id"],
+        "calendar_id": calendar_id,
+        "resource_id": result["resourceId"],
+        "token": token,
+        "address": address,
+        # expiration is milliseconds since the epoch, as a string
+        "expiration": int(result.get("expiration", 0)) / 1000 or time.time() + ttl_seconds
+    }
+    gcal_sync.save_channel(channel)
+    return channel
+
+
+def stop_channel(channel: Dict[str, Any], service=None) -> bool:
+    """Stop a channel at Google (best effort) and forget it locally."""
+    if service is None:
+        service = get_calendar_service()
+    stopped = False
+    if service:
+        try:
+            gcal_api.execute(service.channels().stop(body={
+                "id": channel["channel_id"],
+                "resourceId": channel["resource_id"]
+            }))
+            stopped = True
+        except CalendarAPIError as e:
+            print(f"Warning: could not stop channel {channel['channel_id']}: {e}")
+    gcal_sync.delete_channel(channel["channel_id"])
+    return stopped
+
+
+def renew_channels(margin_seconds: int = RENEW_BEFORE_SECONDS, service=None) -> int:
+    """
+    Replace channels that expire within `margin_seconds`.
+    
+    The new channel is opened before the old one is stopped, so no
+    notification window is lost. Expired channels are simply reopened.
+    
+    Returns:
+        Number of channels renewed
+    """
+    renewed = 0
+    deadline = time.time() + margin_seconds
+    for channel in gcal_sync.list_channels():
+        if channel["expiration"] > deadline:
+            break  # Sorted by expiration
+        if start_channel(channel["calendar_id"], channel["address"], service=service):
+            stop_channel(channel, service=service)
+            renewed += 1
+    return renewed
+
+
+# =============================================================================
+# RECEIVER
+# =============================================================================
+
+class _NotificationHandler(BaseHTTPRequestHandler):
+    """Validates X-Goog-* notification headers and queues the calendar for sync."""
+    
+    server: "NotificationReceiver"
+    
+    def do_POST(self) -> None:
+        """Handle one notification (the response code is all Google looks at)."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)  # Notifications carry no useful body
+        
+        channel = gcal_sync.get_channel(self.headers.get("X-Goog-Channel-ID", ""))
+        if channel is None:
+            self._reply(404)
+            return
+        if not secrets.compare_digest(self.headers.get("X-Goog-Channel-Token", ""),
+                                      channel["token"]) or \
+                self.headers.get("X-Goog-Resource-ID") != channel["resource_id"]:
+            self._reply(403)
+            return
+        
+        # "sync" is the handshake sent when the channel opens; anything else
+        # ("exists", "not_exists") means the calendar changed
+        if self.headers.get("X-Goog-Resource-State") != "sync":
+            self.server.notify(channel["calendar_id"])
+        self._reply(200)
+    
+    def _reply(self, status: int) -> None:
+        """Send an empty response."""
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def log_message(self, format: str, *args) -> None:
+        pass  # Keep the receiver quiet; notifications can be frequent
+
+
+class NotificationReceiver(ThreadingHTTPServer):
+    """
+    Webhook endpoint for Calendar push notifications.
+    
+    Each notification marks its calendar stale right away (so readers stop
+    trusting the store) and queues it for `on_change`, which by default runs
+    an incremental sync. Bursts for one calendar collapse into one sync.
+    """
+    
+    daemon_threads = True
+    
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        on_change: Callable[[str], Any] = None
+    ):
+        super().__init__((host, port), _NotificationHandler)
+        self.on_change = on_change or gcal_sync.sync_calendar
+        self._pending: "queue.Queue[str]" = queue.Queue()
+        self._queued = set()
+        self._queued_lock = threading.Lock()
+        self.notifications = 0
+        self.syncs = 0
+        threading.Thread(target=self._sync_worker, daemon=True).start()
+    
+    def notify(self, calendar_id: str) -> None:
+        """Mark a calendar stale and queue it for syncing (coalescing repeats)."""
+        self.notifications += 1
+        gcal_sync.mark_stale(calendar_id)
+        with self._queued_lock:
+            if calendar_id in self._queued:
+                return
+            self._queued.add(calendar_id)
+        self._pending.put(calendar_id)
+    
+    def wait_idle(self, timeout: float = None) -> None:
+        """Block until every queued calendar has been synced."""
+        deadline = None if timeout is None else time.time() + timeout
+        while self._pending.unfinished_tasks:
+            if deadline is not None and time.time() > deadline:
+                return
+            time.sleep(0.01)
+    
+    def _sync_worker(self) -> None:
+        """Run on_change for queued calendars, one at a time."""
+        while True:
+            calendar_id = self._pending.get()
+            with self._queued_lock:
+                self._queued.discard(calendar_id)
+            try:
+                self.on_change(calendar_id)
+                self.syncs += 1
+            except Exception as e:
+                print(f"Error syncing {calendar_id} after notification: {e}")
+            finally:
+                self._pending.task_done()
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """Run the receiver, renewing channels and reporting liveness periodically."""
+    enable_refresh_ahead()
+    receiver = NotificationReceiver(host, port)
+    threading.Thread(target=receiver.serve_forever, daemon=True).start()
+    print(f"[OK] Listening for Calendar notifications on http://{host}:{receiver.server_port}/")
+    try:
+        while True:
+            gcal_sync.touch_channels()
+            renewed = renew_channels()
+            if renewed:
+                print(f"Renewed {renewed} channel(s)")
+            time.sleep(MAINTENANCE_INTERVAL_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        receiver.shutdown()
+
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="gcal-pro push notifications")
+    parser.add_argument("command", choices=["start", "stop", "list", "renew", "serve"],
+                        help="Watch command")
+    parser.add_argument("--calendar", "-c", default="primary",
+                        help="Calendar ID for start/stop (default: primary)")
+    parser.add_argument("--address", help="Public HTTPS URL of the receiver (start)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Receiver bind address (serve)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Receiver port (serve)")
+    
+    args = parser.parse_args()
+    
+    if args.command == "start":
+        if not args.address:
+            print("Error: --address required for start")
+            sys.exit(1)
+        channel = start_channel(args.calendar, args.address)
+        if not channel:
+            sys.exit(1)
+        # Make sure there is a sync token for the first notification to build on
+        gcal_sync.sync_calendar(args.calendar)
+        expires = time.strftime("%Y-%m-%d %H:%M", time.localtime(channel["expiration"]))
+        print(f"[OK] Watching {args.calendar} (channel {channel['channel_id']}, expires {expires})")
+    
+    elif args.command == "stop":
+        channels = gcal_sync.list_channels(args.calendar)
+        for channel in channels:
+            stop_channel(channel)
+        print(f"[OK] Stopped {len(channels)} channel(s) for {args.calendar}")
+    
+    elif args.command == "list":
+        channels = gcal_sync.list_channels()
+        if not channels:
+            print("No push channels.")
+        for channel in channels:
+            expires = time.strftime("%Y-%m-%d %H:%M", time.localtime(channel["expiration"]))
+            live = "live" if gcal_sync.is_watched(channel["calendar_id"]) else "receiver down"
+            print(f"  • {channel['calendar_id']}: expires {expires} ({live})")
+            print(f"    ID: {channel['channel_id']}  ->  {channel['address']}")
+    
+    elif args.command == "renew":
+        print(f"[OK] Renewed {renew_channels()} channel(s)")
+    
+    elif args.command == "serve":
+        serve(args.host, args.port)